@@ -8,103 +8,366 @@ Beautiful web-based dashboard with:
 """
 
 import os
-import json
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 from flask import Flask, render_template, jsonify, request
-from threading import Thread
+from threading import Thread, Lock, RLock, Event
 import pyautogui
 
+from modules.storage.json_utils import loads, dumps, load_json, dump_json
+from modules.storage.data_manager import read_session_summary
+
 app = Flask(__name__)
 
+def json_response(obj):
+    """Build a JSON response serialized with orjson (stdlib json fallback)"""
+    return app.response_class(dumps(obj), mimetype='application/json')
+
+def conditional_json_response(build):
+    """Serve build(version) as JSON, or an empty 304 if the client's ETag is still current"""
+    # Fingerprint the files once per request; build() reuses it instead of scanning again
+    version = controller.get_workflows_version()
+    etag = controller.get_data_version(version)
+    
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = json_response(build(version))
+    
+    response.set_etag(etag)
+    return response
+
+class ExecutionLog:
+    """Bounded execution log stored column-wise, one deque per field"""
+    
+    def __init__(self, maxlen=500):
+        self.timestamps = deque(maxlen=maxlen)
+        self.messages = deque(maxlen=maxlen)
+        self.steps = deque(maxlen=maxlen)
+        self.last_seq = 0  # seq of the newest entry; never reset
+        self._lock = Lock()
+    
+    def append(self, message, step=None):
+        """Add one entry"""
+        with self._lock:
+            self.timestamps.append(datetime.now().isoformat())
+            self.messages.append(message)
+            self.steps.append(step)
+            self.last_seq += 1
+    
+    def clear(self):
+        """Drop buffered entries (seq numbers keep counting up)"""
+        with self._lock:
+            self.timestamps.clear()
+            self.messages.clear()
+            self.steps.clear()
+    
+    def since(self, seq):
+        """Columns for entries newer than seq; entry i has seq base + i + 1"""
+        with self._lock:
+            if seq > self.last_seq:
+                seq = 0  # client is ahead of us, e.g. after a server restart
+            
+            count = len(self.messages)
+            start = max(0, count - (self.last_seq - seq))
+            return {
+                'last_seq': self.last_seq,
+                'base': self.last_seq - count + start,
+                'ts': list(islice(self.timestamps, start, None)),
+                'msg': list(islice(self.messages, start, None)),
+                'step': list(islice(self.steps, start, None))
+            }
+
 # Global state
-automation_running = False
-execution_logs = []
+automation_running = Event()
+execution_logs = ExecutionLog(maxlen=500)
+execution_lock = Lock()
 learning_history = []
 
+# Learning curve entries kept for the dashboard, and the log size that triggers compaction
+LEARNING_CURVE_LIMIT = 100
+LEARNING_CURVE_COMPACT_BYTES = 256 * 1024
+
+# Pause after each step, in ms. wait steps already slept and pyautogui paces
+# keystrokes itself; clicks and app launches need time for the UI to react.
+STEP_DELAYS_MS = {
+    'wait': 0,
+    'type': 50,
+    'type_text': 50,
+    'hotkey': 50,
+    'save_file': 50,
+    'close_window': 50,
+    'click': 300,
+    None: 1000
+}
+
+# Reasoning shown for each smart action type
+SMART_REASONING = {
+    'open_application': "Opening application using OS-specific launcher (Spotlight/Run dialog)",
+    'type_text': "Typing text into active field - validated and filtered for quality",
+    'click': "Locating element on screen using OCR, then clicking dynamically",
+    'save_file': "Using universal save shortcut based on detected OS platform",
+    'close_window': "Using universal close shortcut based on detected OS platform",
+    'wait': "Pausing to allow UI to update and respond to previous action",
+    'hotkey': "Executing keyboard shortcut, adjusted for current platform"
+}
+
+@lru_cache(maxsize=1024)
+def smart_reasoning(action_type, desc_lower):
+    """Reasoning text for a smart action, memoized on (action type, lowercased description)"""
+    base_reason = SMART_REASONING.get(action_type, "Executing learned workflow step")
+    
+    # Add context
+    if 'demo' in desc_lower:
+        return f"{base_reason}. This is a demonstration workflow."
+    elif 'save' in desc_lower:
+        return f"{base_reason}. Saving work to persist changes."
+    elif 'open' in desc_lower:
+        return f"{base_reason}. Launching required application."
+    
+    return base_reason
+
 class DashboardController:
     def __init__(self):
         self.data_dir = Path("data")
         self.workflows_dir = self.data_dir / "workflows"
         self.json_dir = self.data_dir / "json"
         self.learning_db = self.data_dir / "learning_database.json"
+        self.learning_curve_log = self.data_dir / "learning_curve.jsonl"
+        
+        # Parsed learning database, reused until the file changes on disk
+        self._learning_cache = None
+        self._learning_mtime = 0
+        self._curve_cache = None
+        self._curve_mtime = 0
+        
+        # Parsed workflow / session summary files keyed by path -> (st_mtime_ns, data)
+        self._wf_cache = {}
+        self._summary_cache = {}
+        self._summary_names = None
+        self._summary_names_mtime = None
+        self._stats_snapshot = None
+        
+        # Request handlers run on several threads: guard the caches and learning DB
+        self._cache_lock = Lock()
+        self._learning_lock = RLock()
+        
+        # Long-lived pool for parsing workflow files in parallel across polls
+        self._executor = ThreadPoolExecutor(max_workers=8)
         
         # Initialize learning database
         self.load_learning_data()
     
     def load_learning_data(self):
-        """Load continual learning database"""
-        if self.learning_db.exists():
-            with open(self.learning_db, 'r') as f:
-                return json.load(f)
-        return {
-            'total_sessions': 0,
-            'total_automations': 0,
-            'workflow_improvements': {},
-            'success_rate': {},
-            'learning_curve': []
-        }
+        """Load continual learning database (cached until the file changes)"""
+        with self._learning_lock:
+            try:
+                mtime = self.learning_db.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+        
+            if mtime is None:
+                data = {
+                    'total_sessions': 0,
+                    'total_automations': 0,
+                    'workflow_improvements': {},
+                    'success_rate': {}
+                }
+            elif self._learning_cache is not None and mtime == self._learning_mtime:
+                data = self._learning_cache
+            else:
+                data = load_json(self.learning_db)
+            
+                # Older databases stored the curve inline; move it to the append-only log
+                legacy_curve = data.pop('learning_curve', None)
+                if legacy_curve and not self.learning_curve_log.exists():
+                    self.append_learning_curve(legacy_curve[-LEARNING_CURVE_LIMIT:])
+            
+                self._learning_cache = data
+                self._learning_mtime = mtime
+        
+            data['learning_curve'] = self.load_learning_curve()
+            return data
     
     def save_learning_data(self, data):
-        """Save learning progress"""
-        with open(self.learning_db, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Save learning progress (aggregate counters only)"""
+        counters = {k: v for k, v in data.items() if k != 'learning_curve'}
+        dump_json(counters, self.learning_db)
+        
+        self._learning_cache = data
+        self._learning_mtime = self.learning_db.stat().st_mtime_ns
     
-    def get_all_workflows(self):
-        """Get all available workflows with metadata"""
+    def load_learning_curve(self):
+        """Load the most recent learning curve entries from the append-only log"""
+        try:
+            mtime = self.learning_curve_log.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        if self._curve_cache is not None and mtime == self._curve_mtime:
+            return self._curve_cache
+        
+        with open(self.learning_curve_log, 'rb') as f:
+            tail = deque(f, maxlen=LEARNING_CURVE_LIMIT)
+        
+        self._curve_cache = [loads(line) for line in tail if line.strip()]
+        self._curve_mtime = mtime
+        return self._curve_cache
+    
+    def append_learning_curve(self, entries):
+        """Append learning curve entries, one JSON document per line"""
+        with open(self.learning_curve_log, 'ab') as f:
+            f.write(b''.join(dumps(entry, newline=True) for entry in entries))
+            size = f.tell()
+        
+        # Compact once the log has grown well past what the dashboard shows
+        if size > LEARNING_CURVE_COMPACT_BYTES:
+            with open(self.learning_curve_log, 'rb') as f:
+                tail = deque(f, maxlen=LEARNING_CURVE_LIMIT)
+            with open(self.learning_curve_log, 'wb') as f:
+                f.writelines(tail)
+    
+    def get_all_workflows(self, version=None):
+        """Get all available workflows with metadata (version: a get_workflows_version() result taken just before)"""
         workflows = []
+        if version is None:
+            version = self.get_workflows_version()
         
         if not self.workflows_dir.exists():
+            self._stats_snapshot = {'version': version, 'total_workflows': 0, 'sum_potential': 0}
             return workflows
         
-        for wf_file in sorted(self.workflows_dir.glob("workflow_*.json"), 
-                             key=lambda p: p.stat().st_mtime, reverse=True):
+        learning_data = self.load_learning_data()
+        
+        # One directory listing each: stat results come with the entries
+        with os.scandir(self.workflows_dir) as it:
+            entries = [e for e in it
+                       if e.name.startswith("workflow_") and e.name.endswith(".json")
+                       and e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        
+        summary_names = self.list_summary_names()
+        
+        # Parse in parallel, then assemble in the sorted order
+        futures = [self._executor.submit(self.load_workflow_entry, entry, summary_names)
+                   for entry in entries]
+        
+        for entry, future in zip(entries, futures):
             try:
-                with open(wf_file, 'r') as f:
-                    wf = json.load(f)
-                
-                # Get corresponding session summary
+                wf, summary = future.result()
                 session_id = wf.get('workflow_id')
-                summary = self.get_session_summary(session_id)
                 
                 workflows.append({
                     'id': session_id,
-                    'filename': wf_file.name,
+                    'filename': entry.name,
                     'created_at': wf.get('created_at'),
                     'steps_count': len(wf.get('automation_steps', [])),
                     'automation_potential': summary.get('automation_potential', 0),
                     'workflow_summary': summary.get('workflow_summary', 'No summary'),
                     'detected_actions': summary.get('detected_actions', []),
                     'patterns': summary.get('detected_patterns', []),
-                    'execution_count': self.get_execution_count(session_id),
-                    'success_rate': self.get_success_rate(session_id),
-                    'last_executed': self.get_last_execution(session_id)
+                    'execution_count': self.get_execution_count(session_id, learning_data),
+                    'success_rate': self.get_success_rate(session_id, learning_data),
+                    'last_executed': self.get_last_execution(session_id, learning_data)
                 })
             except Exception as e:
-                print(f"Error loading workflow {wf_file.name}: {e}")
+                print(f"Error loading workflow {entry.name}: {e}")
+        
+        # Aggregates for /api/stats, valid until a workflow or summary file changes
+        self._stats_snapshot = {
+            'version': version,
+            'total_workflows': len(workflows),
+            'sum_potential': sum(w['automation_potential'] for w in workflows)
+        }
+        
+        # Forget files that were deleted since the last scan
+        with self._cache_lock:
+            for path in self._wf_cache.keys() - {e.path for e in entries}:
+                del self._wf_cache[path]
+            for name in self._summary_cache.keys() - summary_names:
+                del self._summary_cache[name]
         
         return workflows
     
-    def get_session_summary(self, session_id):
+    def load_workflow_entry(self, entry, summary_names):
+        """Load one workflow file and its session summary"""
+        wf = self.load_workflow_cached(entry.path, entry.stat().st_mtime_ns)
+        summary = self.get_session_summary(wf.get('workflow_id'), summary_names)
+        return wf, summary
+    
+    def load_workflow_cached(self, path, mtime_ns):
+        """Load a workflow file, reusing the parsed copy while its mtime is unchanged"""
+        with self._cache_lock:
+            cached = self._wf_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        wf = load_json(path)
+        with self._cache_lock:
+            self._wf_cache[path] = (mtime_ns, wf)
+        return wf
+    
+    def list_summary_names(self):
+        """Get the set of session summary filenames (rescanned only when json_dir changes)"""
+        try:
+            dir_mtime = self.json_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return set()
+        
+        # Adding or removing a file bumps the directory mtime, so the snapshot stays valid until then
+        if self._summary_names is not None and dir_mtime == self._summary_names_mtime:
+            return self._summary_names
+        
+        with os.scandir(self.json_dir) as it:
+            names = {e.name for e in it if e.name.startswith("session_summary_")}
+        self._summary_names = names
+        self._summary_names_mtime = dir_mtime
+        return names
+    
+    def get_session_summary(self, session_id, summary_names=None):
         """Get session summary for a workflow"""
-        summary_file = self.json_dir / f"session_summary_{session_id}.json"
+        # A directory snapshot answers "does it exist?" without a stat per workflow
+        if summary_names is None:
+            summary_names = self.list_summary_names()
+        
+        # Prefer the .jsonl summary; .json is the format older sessions used
+        filename = f"session_summary_{session_id}.jsonl"
+        if filename not in summary_names:
+            filename = f"session_summary_{session_id}.json"
+            if filename not in summary_names:
+                return {}
+        summary_file = self.json_dir / filename
         
-        if summary_file.exists():
-            with open(summary_file, 'r') as f:
-                data = json.load(f)
-                return data.get('llm_analysis', {})
-        
-        return {}
+        try:
+            mtime_ns = summary_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        
+        with self._cache_lock:
+            cached = self._summary_cache.get(filename)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        analysis = read_session_summary(summary_file).get('llm_analysis', {})
+        with self._cache_lock:
+            self._summary_cache[filename] = (mtime_ns, analysis)
+        return analysis
     
-    def get_execution_count(self, workflow_id):
+    def get_execution_count(self, workflow_id, learning_data=None):
         """Get how many times workflow was executed"""
-        learning_data = self.load_learning_data()
+        if learning_data is None:
+            learning_data = self.load_learning_data()
         return learning_data.get('success_rate', {}).get(workflow_id, {}).get('total', 0)
     
-    def get_success_rate(self, workflow_id):
+    def get_success_rate(self, workflow_id, learning_data=None):
         """Get success rate for workflow"""
-        learning_data = self.load_learning_data()
+        if learning_data is None:
+            learning_data = self.load_learning_data()
         stats = learning_data.get('success_rate', {}).get(workflow_id, {})
         
         total = stats.get('total', 0)
@@ -114,42 +377,78 @@ class DashboardController:
             return 0
         return int((successful / total) * 100)
     
-    def get_last_execution(self, workflow_id):
+    def get_last_execution(self, workflow_id, learning_data=None):
         """Get timestamp of last execution"""
-        learning_data = self.load_learning_data()
+        if learning_data is None:
+            learning_data = self.load_learning_data()
         return learning_data.get('success_rate', {}).get(workflow_id, {}).get('last_run', None)
     
-    def get_dashboard_stats(self):
-        """Get overall statistics for dashboard"""
+    def get_dashboard_stats(self, version=None):
+        """Get overall statistics for dashboard (version: a get_workflows_version() result taken just before)"""
         learning_data = self.load_learning_data()
-        workflows = self.get_all_workflows()
+        if version is None:
+            version = self.get_workflows_version()
         
-        total_automation_potential = sum(w['automation_potential'] for w in workflows)
-        avg_potential = total_automation_potential / len(workflows) if workflows else 0
+        # Reuse the aggregate from the last workflow scan while no workflow or summary file changed
+        snapshot = self._stats_snapshot
+        if snapshot is None or snapshot['version'] != version:
+            self.get_all_workflows(version)
+            snapshot = self._stats_snapshot
+        
+        total_workflows = snapshot['total_workflows']
+        avg_potential = snapshot['sum_potential'] / total_workflows if total_workflows else 0
         
         return {
-            'total_workflows': len(workflows),
+            'total_workflows': total_workflows,
             'total_sessions': learning_data.get('total_sessions', 0),
             'total_automations': learning_data.get('total_automations', 0),
             'avg_automation_potential': round(avg_potential, 1),
             'learning_curve': learning_data.get('learning_curve', [])
         }
     
-    def execute_workflow_with_feedback(self, workflow_id):
-        """Execute workflow with real-time feedback using SMART ENGINE"""
-        global automation_running, execution_logs
+    @staticmethod
+    def _files_fingerprint(path, prefix):
+        """(name, mtime, size) of every file in path starting with prefix, in name order"""
+        # A file rewritten in place keeps its directory's mtime, so look at the files themselves
+        try:
+            with os.scandir(path) as it:
+                stats = [(e.name, e.stat()) for e in it if e.name.startswith(prefix)]
+        except FileNotFoundError:
+            return ()
+        return tuple(sorted((name, st.st_mtime_ns, st.st_size) for name, st in stats))
+    
+    def get_workflows_version(self):
+        """Fingerprint of the workflow and session summary files"""
+        return (self._files_fingerprint(self.workflows_dir, "workflow_"),
+                self._files_fingerprint(self.json_dir, "session_summary_"))
+    
+    def get_data_version(self, workflows_version=None):
+        """Fingerprint of the files behind the dashboard views, used as an ETag"""
+        if workflows_version is None:
+            workflows_version = self.get_workflows_version()
+        parts = [workflows_version]
+        for path in (self.learning_db, self.learning_curve_log):
+            try:
+                st = path.stat()
+                parts.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                parts.append(None)
+        # hash() is salted per process, so a dashboard restart only costs one full response
+        return format(hash(tuple(parts)) & 0xFFFFFFFFFFFFFFFF, 'x')
+    
+    def execute_workflow_with_feedback(self, workflow_id, fast=False):
+        """Execute workflow with real-time feedback using SMART ENGINE
         
-        automation_running = True
-        execution_logs = []
+        Args:
+            workflow_id: Workflow to run
+            fast: Skip the countdown and inter-step pauses (wait steps still wait)
+        """
+        automation_running.set()
+        execution_logs.clear()
         
         def log_feedback(message, step_info=None):
             """Add feedback to execution log"""
-            log_entry = {
-                'timestamp': datetime.now().isoformat(),
-                'message': message,
-                'step': step_info
-            }
-            execution_logs.append(log_entry)
+            execution_logs.append(message, step_info)
             print(f"💬 {message}")
         
         try:
@@ -165,14 +464,14 @@ class DashboardController:
             log_feedback(f"🚀 Starting SMART automation for workflow: {workflow_id}")
             log_feedback(f"🧠 Using intelligent, cross-platform engine")
             log_feedback("⏱️  Preparing automation...")
-            time.sleep(1)
+            if not fast:
+                time.sleep(1)
             
             # Create smart engine
             engine = SmartAutomationEngine()
             
-            # Load workflow
-            with open(workflow_file, 'r') as f:
-                workflow = json.load(f)
+            # Load workflow (parsed and normalized once per file version)
+            workflow = self.load_workflow_cached(str(workflow_file), workflow_file.stat().st_mtime_ns)
             
             steps = workflow.get('automation_steps', [])
             log_feedback(f"📋 Original workflow has {len(steps)} steps")
@@ -182,27 +481,38 @@ class DashboardController:
             smart_actions = engine.create_smart_workflow(steps)
             
             log_feedback(f"✅ Prepared {len(smart_actions)} optimized actions")
-            log_feedback("⏱️  Starting in 3 seconds - prepare your screen!")
-            time.sleep(3)
+            if not fast:
+                log_feedback("⏱️  Starting in 3 seconds - prepare your screen!")
+                time.sleep(3)
+            
+            # Pause after each step depends on the action; workflows may override via step_delay_ms
+            step_delays = self.get_step_delays(workflow, fast)
             
             successful_steps = 0
+            total = len(smart_actions)
+            
+            # Bind the per-step callables once
+            execute_action = engine.execute_action_intelligently
+            get_reasoning = self.get_smart_reasoning
+            sleep = time.sleep
+            default_delay = step_delays.get(None, 0)
             
             # Execute each action with smart engine
             for i, action in enumerate(smart_actions, 1):
-                if not automation_running:
+                if not automation_running.is_set():
                     log_feedback("⚠️  Automation stopped by user")
                     break
                 
                 desc = action.get('description', action.get('action', 'Unknown'))
-                log_feedback(f"📍 Step {i}/{len(smart_actions)}: {desc}")
+                log_feedback(f"📍 Step {i}/{total}: {desc}")
                 
                 # Get reasoning
-                reasoning = self.get_smart_reasoning(action)
+                reasoning = get_reasoning(action)
                 log_feedback(f"🤔 Reasoning: {reasoning}")
                 
                 # Execute with smart engine
                 try:
-                    success = engine.execute_action_intelligently(action)
+                    success = execute_action(action)
                     
                     if success:
                         log_feedback(f"✅ Step {i} completed successfully")
@@ -210,7 +520,9 @@ class DashboardController:
                     else:
                         log_feedback(f"⚠️  Step {i} had issues but continuing")
                     
-                    time.sleep(1)
+                    delay = step_delays.get(action.get('action'), default_delay)
+                    if delay:
+                        sleep(delay)
                 
                 except Exception as e:
                     log_feedback(f"❌ Error in step {i}: {str(e)}")
@@ -232,101 +544,80 @@ class DashboardController:
             # Update learning database
             self.update_learning_data(workflow_id, success_rate >= 70, successful_steps, len(smart_actions))
             
-            automation_running = False
             return True
         
         except Exception as e:
             log_feedback(f"❌ Critical error: {e}")
             import traceback
             log_feedback(f"📋 Details: {traceback.format_exc()}")
-            automation_running = False
             return False
+        
+        finally:
+            automation_running.clear()
+    
+    @staticmethod
+    def get_step_delays(workflow, fast=False):
+        """
+        Resolve the pause (in seconds) after each action type
+        
+        Args:
+            workflow: Workflow dict; 'step_delay_ms' may be a number for every
+                step or a dict of action -> milliseconds
+            fast: Drop every pause
+            
+        Returns:
+            Dict of action -> seconds, with the default under the None key
+        """
+        if fast:
+            return {None: 0}
+        
+        delays_ms = dict(STEP_DELAYS_MS)
+        override = workflow.get('step_delay_ms')
+        if isinstance(override, dict):
+            delays_ms.update(override)
+        elif isinstance(override, (int, float)):
+            delays_ms = {None: override}
+        
+        return {action: ms / 1000 for action, ms in delays_ms.items()}
     
     def get_smart_reasoning(self, action):
         """Generate intelligent reasoning for smart actions"""
-        action_type = action.get('action')
-        description = action.get('description', '')
-        
-        reasoning_map = {
-            'open_application': "Opening application using OS-specific launcher (Spotlight/Run dialog)",
-            'type_text': "Typing text into active field - validated and filtered for quality",
-            'click': "Locating element on screen using OCR, then clicking dynamically",
-            'save_file': "Using universal save shortcut based on detected OS platform",
-            'close_window': "Using universal close shortcut based on detected OS platform",
-            'wait': "Pausing to allow UI to update and respond to previous action",
-            'hotkey': "Executing keyboard shortcut, adjusted for current platform"
-        }
-        
-        base_reason = reasoning_map.get(action_type, "Executing learned workflow step")
-        
-        # Add context
-        if 'demo' in description.lower():
-            return f"{base_reason}. This is a demonstration workflow."
-        elif 'save' in description.lower():
-            return f"{base_reason}. Saving work to persist changes."
-        elif 'open' in description.lower():
-            return f"{base_reason}. Launching required application."
-        
-        return base_reason
-    
-    def get_reasoning_for_action(self, step, workflow):
-        """Generate human-readable reasoning for action"""
-        action = step.get('action')
-        description = step.get('description', '')
-        
-        reasoning_templates = {
-            'click': "I need to click this element to proceed with the workflow",
-            'type': "I'm entering this text because it was part of the observed pattern",
-            'wait': "I'm pausing to allow the UI to update and respond",
-            'hotkey': "I'm using this keyboard shortcut as it was detected in the original workflow"
-        }
-        
-        base_reason = reasoning_templates.get(action, "Executing this step as part of the learned workflow")
-        
-        # Add context
-        if 'save' in description.lower():
-            return f"{base_reason}. This appears to be a save operation."
-        elif 'open' in description.lower():
-            return f"{base_reason}. This will open the application or file."
-        elif 'close' in description.lower():
-            return f"{base_reason}. This will close the current window."
-        
-        return base_reason
+        # Lowercase once per action; repeated (type, description) pairs hit the cache
+        description = action.get('description') or ''
+        return smart_reasoning(action.get('action'), description.lower())
     
     def update_learning_data(self, workflow_id, success, successful_steps, total_steps):
         """Update continual learning database"""
-        learning_data = self.load_learning_data()
-        
-        # Update totals
-        learning_data['total_automations'] = learning_data.get('total_automations', 0) + 1
-        
-        # Update workflow-specific stats
-        if workflow_id not in learning_data['success_rate']:
-            learning_data['success_rate'][workflow_id] = {
-                'total': 0,
-                'successful': 0,
-                'last_run': None
-            }
+        with self._learning_lock:
+            learning_data = self.load_learning_data()
+        
+            # Update totals
+            learning_data['total_automations'] = learning_data.get('total_automations', 0) + 1
+        
+            # Update workflow-specific stats
+            if workflow_id not in learning_data['success_rate']:
+                learning_data['success_rate'][workflow_id] = {
+                    'total': 0,
+                    'successful': 0,
+                    'last_run': None
+                }
+        
+            stats = learning_data['success_rate'][workflow_id]
+            stats['total'] += 1
+            if success:
+                stats['successful'] += 1
+            stats['last_run'] = datetime.now().isoformat()
+        
+            # Update learning curve
+            self.append_learning_curve([{
+                'timestamp': datetime.now().isoformat(),
+                'workflow_id': workflow_id,
+                'success': success,
+                'steps_completed': successful_steps,
+                'total_steps': total_steps
+            }])
         
-        stats = learning_data['success_rate'][workflow_id]
-        stats['total'] += 1
-        if success:
-            stats['successful'] += 1
-        stats['last_run'] = datetime.now().isoformat()
-        
-        # Update learning curve
-        learning_data['learning_curve'].append({
-            'timestamp': datetime.now().isoformat(),
-            'workflow_id': workflow_id,
-            'success': success,
-            'steps_completed': successful_steps,
-            'total_steps': total_steps
-        })
-        
-        # Keep only last 100 entries
-        learning_data['learning_curve'] = learning_data['learning_curve'][-100:]
-        
-        self.save_learning_data(learning_data)
+            self.save_learning_data(learning_data)
 
 # Initialize controller
 controller = DashboardController()
@@ -340,25 +631,26 @@ def index():
 @app.route('/api/workflows')
 def get_workflows():
     """API endpoint to get all workflows"""
-    workflows = controller.get_all_workflows()
-    return jsonify(workflows)
+    return conditional_json_response(controller.get_all_workflows)
 
 @app.route('/api/stats')
 def get_stats():
     """API endpoint to get dashboard statistics"""
-    stats = controller.get_dashboard_stats()
-    return jsonify(stats)
+    return conditional_json_response(controller.get_dashboard_stats)
 
 @app.route('/api/execute/<workflow_id>', methods=['POST'])
 def execute_workflow(workflow_id):
     """API endpoint to execute a workflow"""
-    global automation_running
+    # Check-and-set atomically so two concurrent requests can't both start a run
+    with execution_lock:
+        if automation_running.is_set():
+            return jsonify({'error': 'Automation already running'}), 400
+        automation_running.set()
     
-    if automation_running:
-        return jsonify({'error': 'Automation already running'}), 400
+    fast = request.args.get('fast', 'false').lower() == 'true'
     
     # Run in background thread
-    thread = Thread(target=controller.execute_workflow_with_feedback, args=(workflow_id,))
+    thread = Thread(target=controller.execute_workflow_with_feedback, args=(workflow_id, fast))
     thread.start()
     
     return jsonify({'status': 'started', 'workflow_id': workflow_id})
@@ -366,31 +658,26 @@ def execute_workflow(workflow_id):
 @app.route('/api/stop', methods=['POST'])
 def stop_execution():
     """API endpoint to stop automation"""
-    global automation_running
-    automation_running = False
+    automation_running.clear()
     return jsonify({'status': 'stopped'})
 
 @app.route('/api/logs')
 def get_logs():
     """API endpoint to get execution logs (for real-time updates)"""
-    global execution_logs
-    return jsonify({
-        'logs': execution_logs,
-        'running': automation_running
-    })
+    since = request.args.get('since', 0, type=int)
+    
+    logs = execution_logs.since(since)
+    logs['running'] = automation_running.is_set()
+    return json_response(logs)
 
 @app.route('/api/learning')
 def get_learning_data():
     """API endpoint to get learning data"""
     learning_data = controller.load_learning_data()
-    return jsonify(learning_data)
+    return json_response(learning_data)
 
-def create_html_template():
-    """Create the dashboard HTML template"""
-    template_dir = Path("templates")
-    template_dir.mkdir(exist_ok=True)
-    
-    html_content = """<!DOCTYPE html>
+# Dashboard page, written to templates/dashboard.html at startup
+DASHBOARD_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -658,10 +945,22 @@ def create_html_template():
     
     <script>
         let autoUpdateInterval = null;
+        let lastLogSeq = 0;  // highest log seq already rendered
+        const etags = {};
+        
+        // GET a JSON endpoint, resolving to null when the server says nothing changed
+        async function fetchIfChanged(url) {
+            const headers = etags[url] ? { 'If-None-Match': etags[url] } : {};
+            const response = await fetch(url, { headers, cache: 'no-store' });
+            if (response.status === 304) return null;
+            
+            etags[url] = response.headers.get('ETag');
+            return response.json();
+        }
         
         async function loadStats() {
-            const response = await fetch('/api/stats');
-            const stats = await response.json();
+            const stats = await fetchIfChanged('/api/stats');
+            if (!stats) return;
             
             const statsHtml = `
                 <div class="stat-card">
@@ -686,8 +985,8 @@ def create_html_template():
         }
         
         async function loadWorkflows() {
-            const response = await fetch('/api/workflows');
-            const workflows = await response.json();
+            const workflows = await fetchIfChanged('/api/workflows');
+            if (!workflows) return;
             
             if (workflows.length === 0) {
                 document.getElementById('workflowsContainer').innerHTML = `
@@ -742,20 +1041,35 @@ def create_html_template():
         }
         
         async function updateLogs() {
-            const response = await fetch('/api/logs');
+            const response = await fetch(`/api/logs?since=${lastLogSeq}`);
             const data = await response.json();
             
-            const logsHtml = data.logs.map(log => {
-                let className = 'log-entry';
-                if (log.message.includes('❌')) className += ' error';
-                else if (log.message.includes('✅')) className += ' success';
-                else className += ' info';
+            const container = document.getElementById('logContainer');
+            const atBottom = container.scrollHeight - container.scrollTop - container.clientHeight < 5;
+            
+            // The server's seq restarts from 0 when the dashboard restarts
+            if (data.last_seq < lastLogSeq) lastLogSeq = 0;
+            
+            // Logs arrive as columns; entry i has seq data.base + i + 1.
+            // Append only entries we haven't rendered yet
+            data.msg.forEach((message, i) => {
+                const seq = data.base + i + 1;
+                if (seq <= lastLogSeq) return;
                 
-                return `<div class="${className}">${log.message}</div>`;
-            }).join('');
+                const node = document.createElement('div');
+                if (message.includes('❌')) node.className = 'log-entry error';
+                else if (message.includes('✅')) node.className = 'log-entry success';
+                else node.className = 'log-entry info';
+                node.textContent = message;
+                
+                container.appendChild(node);
+                lastLogSeq = seq;
+            });
             
-            document.getElementById('logContainer').innerHTML = logsHtml;
-            document.getElementById('logContainer').scrollTop = document.getElementById('logContainer').scrollHeight;
+            // Follow new output unless the user scrolled up to read
+            if (atBottom) {
+                container.scrollTop = container.scrollHeight;
+            }
             
             // Update running indicator
             if (data.running) {
@@ -763,6 +1077,7 @@ def create_html_template():
             } else {
                 document.getElementById('runningIndicator').innerHTML = '';
                 clearInterval(autoUpdateInterval);
+                autoUpdateInterval = null;
                 loadStats();  // Refresh stats after automation
                 loadWorkflows();  // Refresh workflows
             }
@@ -771,6 +1086,7 @@ def create_html_template():
         async function stopAutomation() {
             await fetch('/api/stop', { method: 'POST' });
             clearInterval(autoUpdateInterval);
+            autoUpdateInterval = null;
         }
         
         function viewDetails(workflowId) {
@@ -781,17 +1097,36 @@ def create_html_template():
         loadStats();
         loadWorkflows();
         
-        // Auto-refresh every 5 seconds
+        // Auto-refresh every 5 seconds, but not in a background tab or while
+        // the log poller is already tracking a running automation
         setInterval(() => {
+            if (document.visibilityState !== 'visible' || autoUpdateInterval) return;
             loadStats();
             loadWorkflows();
         }, 5000);
+        
+        // Catch up as soon as the tab is shown again
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState !== 'visible' || autoUpdateInterval) return;
+            loadStats();
+            loadWorkflows();
+        });
     </script>
 </body>
 </html>"""
+
+def create_html_template():
+    """Create the dashboard HTML template (skipped when it is already up to date)"""
+    template_dir = Path("templates")
+    template_dir.mkdir(exist_ok=True)
+    
+    template_path = template_dir / "dashboard.html"
+    html_bytes = DASHBOARD_HTML.encode('utf-8')
+    
+    if template_path.exists() and template_path.read_bytes() == html_bytes:
+        return
     
-    with open(template_dir / "dashboard.html", 'w') as f:
-        f.write(html_content)
+    template_path.write_bytes(html_bytes)
 
 def main():
     """Start the dashboard server"""
@@ -811,8 +1146,15 @@ def main():
     # Create HTML template
     create_html_template()
     
-    # Start Flask app
-    app.run(debug=False, host='0.0.0.0', port=5000)
+    # Start Flask app on a multi-threaded WSGI server so /api/logs polling
+    # doesn't queue behind /api/workflows and /api/stats
+    try:
+        from waitress import serve
+    except ImportError:
+        print("💡 Install waitress for a production server: pip install waitress\n")
+        app.run(debug=False, host='0.0.0.0', port=5000, threaded=True)
+    else:
+        serve(app, host='0.0.0.0', port=5000, threads=8)
 
 if __name__ == "__main__":
     main()
@@ -3,9 +3,84 @@
 Interactive demo script to showcase all features
 """
 
+import importlib.util
+import os
+import re
+import shutil
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-import json
+
+from modules.storage.json_utils import load_json, should_stream, load_json_header, preview_json_array
+
+# Filename patterns for the menu listings, compiled once at import
+_WF_RE = re.compile(r"^workflow_.*\.json$")
+_SESS_RE = re.compile(r"^session_summary_.*\.jsonl?$")
+
+# Ollama probe result, kept for the rest of the process once Ollama answered
+_ollama_cache = {}
+
+def _probe_ollama():
+    """
+    Query the local Ollama server for installed models
+    
+    Returns:
+        Tuple of (status_code, models), or None if Ollama is unreachable
+    """
+    if "r" in _ollama_cache:
+        return _ollama_cache["r"]
+    
+    try:
+        from modules.http_session import session
+        response = session.get("http://localhost:11434/api/tags", timeout=2)
+        result = (response.status_code, response.json().get('models', []) if response.status_code == 200 else [])
+    except Exception:
+        return None
+    
+    # Only a running server is remembered, so starting Ollama later is still noticed
+    if result[0] == 200:
+        _ollama_cache["r"] = result
+    return result
+
+def _scan_sorted(dirpath, pattern):
+    """
+    List matching files in one scandir pass, newest first
+    
+    Args:
+        dirpath: Directory to scan
+        pattern: Compiled regex the filename must match
+        
+    Returns:
+        List of (mtime_ns, path, name, size) tuples sorted by mtime descending
+    """
+    hits = []
+    with os.scandir(dirpath) as it:
+        for e in it:
+            if pattern.match(e.name) and e.is_file(follow_symlinks=False):
+                st = e.stat()
+                hits.append((st.st_mtime_ns, e.path, e.name, st.st_size))
+    hits.sort(reverse=True)
+    return hits
+
+@lru_cache(maxsize=256)
+def _load_workflow_preview(path, mtime_ns, size):
+    """
+    Read what the workflow listing shows; mtime/size are part of the key so edits miss the cache
+    
+    Returns:
+        Tuple of (header fields, first three steps, step count)
+    """
+    # Large recordings are streamed so only the header and a few steps are kept
+    if should_stream(path):
+        header = load_json_header(path, 'automation_steps')
+        first_steps, steps_count = preview_json_array(path, 'automation_steps', 3)
+        return header, first_steps, steps_count
+    
+    wf = load_json(path)
+    steps = wf.pop('automation_steps', [])
+    return wf, steps[:3], len(steps)
 
 def print_banner():
     banner = """
@@ -90,35 +165,33 @@ def view_workflows():
     print("📊 SAVED WORKFLOWS")
     print("="*60)
     
-    workflows_dir = Path("data/workflows")
+    try:
+        workflows = _scan_sorted("data/workflows", _WF_RE)
+    except FileNotFoundError:
+        workflows = []
     
-    if not workflows_dir.exists() or not list(workflows_dir.glob("*.json")):
+    if not workflows:
         print("\n⚠️  No workflows saved yet")
         print("💡 Run a demo first to generate workflows")
         return
     
-    workflows = sorted(workflows_dir.glob("workflow_*.json"), 
-                      key=lambda p: p.stat().st_mtime, reverse=True)
-    
-    for i, wf_path in enumerate(workflows, 1):
+    for i, (mtime_ns, wf_path, wf_name, size) in enumerate(workflows, 1):
         try:
-            with open(wf_path, 'r') as f:
-                wf = json.load(f)
+            wf, steps, steps_count = _load_workflow_preview(wf_path, mtime_ns, size)
             
-            print(f"\n{i}. {wf_path.name}")
+            print(f"\n{i}. {wf_name}")
             print(f"   ID: {wf.get('workflow_id')}")
             print(f"   Created: {wf.get('created_at', 'Unknown')}")
-            print(f"   Steps: {len(wf.get('automation_steps', []))}")
+            print(f"   Steps: {steps_count}")
             
             # Show first few steps
-            steps = wf.get('automation_steps', [])[:3]
             if steps:
                 print(f"   First steps:")
                 for step in steps:
                     print(f"      • {step.get('description')}")
         
         except Exception as e:
-            print(f"\n{i}. {wf_path.name} (Error: {e})")
+            print(f"\n{i}. {wf_name} (Error: {e})")
 
 def analyze_existing_session():
     """Analyze an existing session file"""
@@ -126,14 +199,11 @@ def analyze_existing_session():
     print("🔍 ANALYZE EXISTING SESSION")
     print("="*60)
     
-    json_dir = Path("data/json")
-    
-    if not json_dir.exists():
-        print("\n⚠️  No sessions found")
-        return
-    
-    sessions = sorted(json_dir.glob("session_summary_*.json"),
-                     key=lambda p: p.stat().st_mtime, reverse=True)
+    # .jsonl summaries, plus .json ones written by older versions
+    try:
+        sessions = _scan_sorted("data/json", _SESS_RE)
+    except FileNotFoundError:
+        sessions = []
     
     if not sessions:
         print("\n⚠️  No sessions found")
@@ -141,20 +211,20 @@ def analyze_existing_session():
     
     print(f"\nFound {len(sessions)} session(s). Analyzing most recent...")
     
-    latest_session = sessions[0]
+    _, latest_session, latest_name, _ = sessions[0]
     
     try:
-        with open(latest_session, 'r') as f:
-            data = json.load(f)
+        from modules.storage.data_manager import read_session_summary
+        data = read_session_summary(latest_session)
         
         session_data = data.get('session_data', {})
         llm_analysis = data.get('llm_analysis', {})
         
-        print(f"\n📄 Session: {latest_session.name}")
+        print(f"\n📄 Session: {latest_name}")
         print(f"   ID: {session_data.get('session_id')}")
         print(f"   Timestamp: {session_data.get('timestamp')}")
         print(f"   Duration: {session_data.get('duration')}s")
-        print(f"   Screenshots: {len(session_data.get('screenshots', []))}")
+        print(f"   Screenshots: {session_data.get('n_screenshots', len(session_data.get('screenshots', [])))}")
         
         # Show analysis
         if llm_analysis:
@@ -176,20 +246,20 @@ def preview_automation():
     print("🤖 AUTOMATION PREVIEW (Dry Run)")
     print("="*60)
     
-    workflows_dir = Path("data/workflows")
+    try:
+        workflows = _scan_sorted("data/workflows", _WF_RE)
+    except FileNotFoundError:
+        workflows = []
     
-    if not workflows_dir.exists() or not list(workflows_dir.glob("*.json")):
+    if not workflows:
         print("\n⚠️  No workflows available")
         return
     
-    workflows = sorted(workflows_dir.glob("workflow_*.json"),
-                      key=lambda p: p.stat().st_mtime, reverse=True)
-    
-    latest_workflow = workflows[0]
-    print(f"\n📄 Using: {latest_workflow.name}")
+    _, latest_workflow, latest_name, _ = workflows[0]
+    print(f"\n📄 Using: {latest_name}")
     
     from run_automation import AutomationRunner
-    runner = AutomationRunner(str(latest_workflow))
+    runner = AutomationRunner(latest_workflow)
     runner.execute_workflow(dry_run=True)
 
 def show_storage_stats():
@@ -224,7 +294,15 @@ def clean_old_data():
     print("🧹 CLEAN OLD DATA")
     print("="*60)
     
-    print("\nThis will delete clips and sessions older than 7 days.")
+    from modules.storage.data_manager import scan_data_dir, get_storage_info, cleanup_old_data
+    
+    # One walk serves both the usage shown here and the cleanup below
+    data_dir = Path("data")
+    entries = scan_data_dir(data_dir)
+    usage = get_storage_info(data_dir, entries)
+    
+    print(f"\nCurrent usage: {usage['total_size_mb']:.2f} MB ({usage['file_count']} files)")
+    print("This will delete clips and sessions older than 7 days.")
     print("Workflows are never deleted automatically.")
     
     confirm = input("\nProceed? (y/n): ").strip().lower()
@@ -233,10 +311,7 @@ def clean_old_data():
         print("Cancelled.")
         return
     
-    from modules.storage.data_manager import cleanup_old_data
-    
-    data_dir = Path("data")
-    stats = cleanup_old_data(data_dir, days_to_keep=7)
+    stats = cleanup_old_data(data_dir, days_to_keep=7, entries=entries)
     
     print(f"\n✅ Cleanup complete:")
     print(f"   Files deleted: {stats['files_deleted']}")
@@ -245,15 +320,24 @@ def clean_old_data():
     if stats['errors']:
         print(f"\n⚠️  {len(stats['errors'])} errors occurred")
 
-def show_system_info():
-    """Show system information"""
+def show_system_info(verify=False):
+    """
+    Show system information
+    
+    Args:
+        verify: Actually import each dependency instead of only locating it
+    """
     print("\n" + "="*60)
     print("ℹ️  SYSTEM INFORMATION")
     print("="*60)
     
-    import sys
     import platform
     
+    # The Ollama request runs while the local checks below are printed
+    executor = ThreadPoolExecutor(max_workers=1)
+    ollama_future = executor.submit(_probe_ollama)
+    executor.shutdown(wait=False)
+    
     print(f"\n🖥️  System:")
     print(f"   OS: {platform.system()} {platform.release()}")
     print(f"   Python: {sys.version.split()[0]}")
@@ -272,18 +356,28 @@ def show_system_info():
         "pytesseract": "PyTesseract (OCR)",
     }
     
+    # find_spec locates a package without running it (whisper would pull in torch)
     for module, desc in deps.items():
-        try:
-            __import__(module)
-            print(f"   ✅ {desc}")
-        except ImportError:
-            print(f"   ❌ {desc}")
+        if verify:
+            try:
+                __import__(module)
+                ok = True
+            except ImportError:
+                ok = False
+        else:
+            ok = importlib.util.find_spec(module) is not None
+        
+        print(f"   {'✅' if ok else '❌'} {desc}")
     
     # Check Tesseract
     print(f"\n🔧 External Tools:")
+    # Look it up on PATH first; only spawn a process when there is something to run
+    tesseract = shutil.which("tesseract")
     try:
+        if tesseract is None:
+            raise FileNotFoundError("tesseract")
         import subprocess
-        result = subprocess.run(["tesseract", "--version"], 
+        result = subprocess.run([tesseract, "--version"], 
                               capture_output=True, text=True)
         if result.returncode == 0:
             version = result.stdout.split('\n')[0]
@@ -294,15 +388,10 @@ def show_system_info():
         print(f"   ❌ Tesseract OCR (Not found)")
     
     # Check Ollama
-    try:
-        import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=2)
-        if response.status_code == 200:
-            models = response.json().get('models', [])
-            print(f"   ✅ Ollama ({len(models)} model(s) installed)")
-        else:
-            print(f"   ⚠️  Ollama (Not running)")
-    except:
+    ollama = ollama_future.result()
+    if ollama and ollama[0] == 200:
+        print(f"   ✅ Ollama ({len(ollama[1])} model(s) installed)")
+    else:
         print(f"   ⚠️  Ollama (Not running)")
 
 def show_help():
@@ -383,7 +472,9 @@ def main():
                 input("\nPress Enter to continue...")
             
             elif choice == '8':
-                show_system_info()
+                # Finding a package is instant; importing it (whisper pulls in torch) can take a while
+                verify = input("\nAlso import each dependency to verify it loads? (slower) (y/N): ").strip().lower() == 'y'
+                show_system_info(verify=verify)
                 show_help()
                 input("\nPress Enter to continue...")
             
@@ -402,8 +493,11 @@ def main():
         
         except Exception as e:
             print(f"\n❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
+            if os.environ.get("AGI_DEBUG"):
+                import traceback
+                traceback.print_exc()
+            else:
+                print("  (set AGI_DEBUG=1 for traceback)")
             input("\nPress Enter to continue...")
 
 if __name__ == "__main__":
@@ -1,18 +1,14 @@
 # main.py - AGI Assistant: Complete Observe & Understand System
 
 import os
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-# Import modules
-from modules.capture.screen_recorder import capture_screenshots
-from modules.capture.audio_recorder import record_audio
-from modules.processing.ocr_processor import extract_text_from_screenshots
-from modules.processing.stt_processor import transcribe_audio
-from modules.llm.local_llm import analyze_session_with_llm
-from modules.storage.data_manager import cleanup_old_data, get_storage_info
+# Import modules (capture/processing/LLM modules are imported when a session starts)
+from modules.storage.data_manager import cleanup_old_data, get_storage_info, scan_data_dir, write_session_summary
+from modules.storage.json_utils import dump_json
 
 class AGIAssistant:
     def __init__(self, session_duration=15, screenshot_interval=3):
@@ -36,6 +32,14 @@ class AGIAssistant:
     
     def start_observation(self):
         """Main observation loop - captures screen and audio"""
+        # Heavy dependencies (mss, sounddevice, whisper/torch, pytesseract) load here,
+        # so menus that never record don't pay for them
+        from modules.capture.screen_recorder import capture_screenshots
+        from modules.capture.audio_recorder import record_audio
+        from modules.processing.ocr_processor import extract_text_from_screenshots
+        from modules.processing.stt_processor import transcribe_audio
+        from modules.llm.local_llm import analyze_session_with_llm
+        
         print("\n" + "="*60)
         print("=== AGI Assistant: Observe & Understand ===")
         print("="*60)
@@ -44,42 +48,65 @@ class AGIAssistant:
         print(f"🎤 Recording audio continuously")
         print("="*60 + "\n")
         
-        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Step 1: Capture Screenshots
-        print("📸 Capturing screenshots...")
-        screenshot_paths = capture_screenshots(
-            duration=self.session_duration,
-            interval=self.screenshot_interval,
-            output_dir=self.clips_dir,
-            session_id=session_id
-        )
-        print(f"✅ Saved {len(screenshot_paths)} screenshots\n")
-        
-        # Step 2: Record Audio
-        print("🎤 Recording audio...")
-        audio_path = record_audio(
-            duration=self.session_duration,
-            output_dir=self.clips_dir,
-            session_id=session_id
-        )
-        print(f"✅ Audio saved: {audio_path}\n")
+        # One clock read so the session id and timestamp always agree
+        now = datetime.now()
+        session_id = f"{now:%Y%m%d_%H%M%S}"
+        session_timestamp = now.isoformat()
+        
+        # Steps 1 & 2: Capture screenshots and record audio over the same window
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            print("📸 Capturing screenshots...")
+            screenshots_future = executor.submit(
+                capture_screenshots,
+                duration=self.session_duration,
+                interval=self.screenshot_interval,
+                output_dir=self.clips_dir,
+                session_id=session_id,
+                archive=True  # OCR below reads the frames straight from the session's zip
+            )
+            
+            print("🎤 Recording audio...")
+            audio_future = executor.submit(
+                record_audio,
+                duration=self.session_duration,
+                output_dir=self.clips_dir,
+                session_id=session_id
+            )
+            
+            screenshot_paths = screenshots_future.result()
+            audio_path = audio_future.result()
         
-        # Step 3: Extract Text from Screenshots (OCR)
-        print("🔍 Extracting text from screenshots (OCR)...")
-        ocr_results = extract_text_from_screenshots(screenshot_paths)
-        print(f"✅ OCR completed for {len(ocr_results)} screenshots\n")
+        print(f"✅ Saved {len(screenshot_paths)} screenshots")
+        print(f"✅ Audio saved: {audio_path}\n")
         
-        # Step 4: Transcribe Audio (Speech-to-Text)
-        print("📝 Transcribing audio...")
-        audio_transcription = transcribe_audio(audio_path)
-        print(f"✅ Audio transcribed: '{audio_transcription.get('text', '')[:100]}...'\n")
+        # Steps 3 & 4: OCR and speech-to-text are independent, run them side by side
+        # (Tesseract runs as a subprocess and whisper releases the GIL in torch)
+        def run_ocr():
+            ocr_results = extract_text_from_screenshots(screenshot_paths)
+            print(f"✅ OCR completed for {len(ocr_results)} screenshots")
+            return ocr_results
+        
+        def run_stt():
+            audio_transcription = transcribe_audio(audio_path)
+            print(f"✅ Audio transcribed: '{audio_transcription.get('text', '')[:100]}...'")
+            return audio_transcription
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            print("🔍 Extracting text from screenshots (OCR)...")
+            ocr_future = executor.submit(run_ocr)
+            
+            print("📝 Transcribing audio...")
+            stt_future = executor.submit(run_stt)
+            
+            ocr_results = ocr_future.result()
+            audio_transcription = stt_future.result()
+        print()
         
         # Step 5: Analyze with LLM
         print("🧠 Analyzing session with local LLM...")
         session_data = {
             "session_id": session_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": session_timestamp,
             "screenshots": screenshot_paths,
             "audio_file": audio_path,
             "ocr_results": ocr_results,
@@ -90,12 +117,8 @@ class AGIAssistant:
         llm_analysis = analyze_session_with_llm(session_data)
         
         # Step 6: Save Results
-        summary_path = self.json_dir / f"session_summary_{session_id}.json"
-        with open(summary_path, 'w') as f:
-            json.dump({
-                "session_data": session_data,
-                "llm_analysis": llm_analysis
-            }, f, indent=2, default=str)
+        summary_path = self.json_dir / f"session_summary_{session_id}.jsonl"
+        write_session_summary(summary_path, session_data, llm_analysis)
         
         print(f"✅ Session summary saved: {summary_path}\n")
         
@@ -104,7 +127,8 @@ class AGIAssistant:
         
         # Step 8: Storage Management
         print("\n📊 Storage Management:")
-        storage_info = get_storage_info(self.data_dir)
+        storage_entries = scan_data_dir(self.data_dir)
+        storage_info = get_storage_info(self.data_dir, storage_entries)
         print(f"   Total size: {storage_info['total_size_mb']:.2f} MB")
         print(f"   Files: {storage_info['file_count']}")
         
@@ -112,7 +136,7 @@ class AGIAssistant:
         cleanup_threshold_mb = 500  # Cleanup if storage exceeds 500MB
         if storage_info['total_size_mb'] > cleanup_threshold_mb:
             print(f"\n🧹 Cleaning up old data (threshold: {cleanup_threshold_mb}MB)...")
-            cleanup_old_data(self.data_dir, days_to_keep=7)
+            cleanup_old_data(self.data_dir, days_to_keep=7, entries=storage_entries)
         
         print("\n" + "="*60)
         print("✅ Session Complete! Ready for automation.")
@@ -130,34 +154,42 @@ class AGIAssistant:
             print("⚠️  No analysis available")
             return
         
+        # One lookup per key (None means the key is absent)
+        get = llm_analysis.get
+        
         # Display workflow summary
-        if "workflow_summary" in llm_analysis:
+        summary = get("workflow_summary")
+        if summary is not None:
             print("\n📋 Workflow Summary:")
-            print(f"   {llm_analysis['workflow_summary']}")
+            print(f"   {summary}")
         
         # Display detected actions
-        if "detected_actions" in llm_analysis:
-            print(f"\n🎯 Detected Actions ({len(llm_analysis['detected_actions'])}):")
-            for i, action in enumerate(llm_analysis['detected_actions'][:5], 1):
+        actions = get("detected_actions")
+        if actions is not None:
+            n_actions = len(actions)
+            print(f"\n🎯 Detected Actions ({n_actions}):")
+            for i, action in enumerate(actions[:5], 1):
                 print(f"   {i}. {action}")
-            if len(llm_analysis['detected_actions']) > 5:
-                print(f"   ... and {len(llm_analysis['detected_actions']) - 5} more")
+            if n_actions > 5:
+                print(f"   ... and {n_actions - 5} more")
         
         # Display automation suggestions
-        if "automation_suggestions" in llm_analysis:
+        suggestions = get("automation_suggestions")
+        if suggestions is not None:
             print("\n🤖 Automation Suggestions:")
-            for suggestion in llm_analysis['automation_suggestions']:
+            for suggestion in suggestions:
                 print(f"   • {suggestion}")
         
         # Display patterns
-        if "detected_patterns" in llm_analysis:
+        patterns = get("detected_patterns")
+        if patterns is not None:
             print("\n🔄 Detected Patterns:")
-            for pattern in llm_analysis['detected_patterns']:
+            for pattern in patterns:
                 print(f"   • {pattern}")
         
         # Display automation potential
-        if "automation_potential" in llm_analysis:
-            potential = llm_analysis['automation_potential']
+        potential = get("automation_potential")
+        if potential is not None:
             print(f"\n⚡ Automation Potential: {potential}/10")
             
             if potential >= 7:
@@ -187,15 +219,18 @@ def main():
         
         # Save workflow if automation potential is high
         if llm_analysis and llm_analysis.get("automation_potential", 0) >= 7:
-            workflow_path = assistant.workflows_dir / f"workflow_{session_data['session_id']}.json"
-            with open(workflow_path, 'w') as f:
-                json.dump({
+            steps = llm_analysis.get("automation_steps") or []
+            if not steps:
+                print("\n⚠️  High potential but no steps extracted; skipping workflow write")
+            else:
+                workflow_path = assistant.workflows_dir / f"workflow_{session_data['session_id']}.json"
+                dump_json({
                     "workflow_id": session_data['session_id'],
-                    "created_at": datetime.now().isoformat(),
-                    "automation_steps": llm_analysis.get("automation_steps", []),
+                    "created_at": session_data["timestamp"],
+                    "automation_steps": steps,
                     "metadata": llm_analysis.get("metadata", {})
-                }, f, indent=2)
-            print(f"\n💾 Automatable workflow saved: {workflow_path}")
+                }, workflow_path)
+                print(f"\n💾 Automatable workflow saved: {workflow_path}")
     
     except KeyboardInterrupt:
         print("\n\n⚠️  Recording interrupted by user")
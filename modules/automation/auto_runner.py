@@ -1,22 +1,124 @@
 # modules/automation/auto_runner.py
+import platform
+import sys
 import pyautogui
 import time
+from functools import partial
 
-def execute_workflow(workflow_steps):
+# With verbose=True, progress is written after every this many steps
+PROGRESS_EVERY = 25
+
+# Text longer than this is pasted in one go instead of typed key by key
+PASTE_MIN_LENGTH = 8
+
+# Time the target app gets to read the pasted text before the user's clipboard is put back
+CLIPBOARD_RESTORE_DELAY = 0.15
+
+# Action -> builder returning (callable, positional args); built once per workflow
+DISPATCH = {
+    "click": lambda a: (pyautogui.click, (a["x"], a["y"])),
+    "type": lambda a: _type_op(a["text"], a.get("sensitive", False)),
+    "hotkey": lambda a: (pyautogui.hotkey, split_keys(a["keys"])),
+    "wait": lambda a: (time.sleep, (a["seconds"],)),
+}
+
+def _type_op(text, sensitive=False):
+    """Pick paste for long single-line text, typewrite otherwise (always for sensitive text)"""
+    if use_paste(text, sensitive):
+        return (paste_text, (text,))
+    return (partial(pyautogui.typewrite, interval=0.05), (text,))
+
+def use_paste(text, sensitive=False):
     """
-    Executes a workflow list generated from workflow_parser
+    Whether text should be pasted instead of typed
+    
+    Args:
+        text: Text of a type step
+        sensitive: The step's "sensitive" arg; such text (passwords, tokens) never
+            touches the clipboard, where clipboard managers would keep a copy
+    """
+    # Tabs/newlines act as keystrokes when typed but may be stripped on paste
+    return not sensitive and len(text) > PASTE_MIN_LENGTH and text.isprintable()
+
+def paste_text(text):
+    """Paste text with a single shortcut, then put the user's clipboard back"""
+    try:
+        import pyperclip
+    except ImportError:
+        pyautogui.typewrite(text, interval=0.05)
+        return
+
+    try:
+        previous = pyperclip.paste()
+        pyperclip.copy(text)
+    except pyperclip.PyperclipException:
+        # No clipboard backend (e.g. Linux without xclip/xsel/wl-clipboard): type it instead
+        pyautogui.typewrite(text, interval=0.05)
+        return
+    
+    try:
+        modifier = 'command' if platform.system() == 'Darwin' else 'ctrl'
+        pyautogui.hotkey(modifier, 'v')
+        time.sleep(CLIPBOARD_RESTORE_DELAY)
+    finally:
+        # Only text survives the round trip; pyperclip can't read other clipboard formats
+        pyperclip.copy(previous)
+
+def split_keys(keys):
+    """Turn "ctrl+s" or ["ctrl", "s"] into a tuple for pyautogui.hotkey"""
+    if isinstance(keys, str):
+        return tuple(keys.lower().replace(' ', '').split('+'))
+    return tuple(keys)
+
+def _compile(workflow_steps):
     """
+    Resolve every step to a bound call before execution starts
+
+    Args:
+        workflow_steps: Steps generated by workflow_parser
+
+    Returns:
+        Tuple of (ops, actions): (callable, args) pairs and their action names
+    """
+    ops = []
+    actions = []
     for step in workflow_steps:
         action = step["action"]
-        args = step.get("args", {})
-        
-        if action == "click":
-            pyautogui.click(args["x"], args["y"])
-        elif action == "type":
-            pyautogui.typewrite(args["text"], interval=0.05)
-        elif action == "hotkey":
-            pyautogui.hotkey(*args["keys"])
-        elif action == "wait":
-            time.sleep(args["seconds"])
-        
-        print(f"Executed: {action}")
+        build = DISPATCH.get(action)
+        if build is None:
+            continue
+        ops.append(build(step.get("args", {})))
+        actions.append(action)
+    return ops, actions
+
+def execute_workflow(workflow_steps, verbose=False):
+    """
+    Executes a workflow list generated from workflow_parser
+
+    Args:
+        workflow_steps: Steps generated by workflow_parser
+        verbose: Report progress while running, not only at the end
+    """
+    ops, actions = _compile(workflow_steps)
+
+    # Timing comes from the workflow's own wait steps, not pyautogui's per-call pause
+    pyautogui.FAILSAFE = True
+    pause = pyautogui.PAUSE
+    pyautogui.PAUSE = 0
+    try:
+        if verbose:
+            for done, (fn, a) in enumerate(ops, 1):
+                fn(*a)
+                if done % PROGRESS_EVERY == 0:
+                    sys.stdout.write(f"Executed {done}/{len(ops)} steps\n")
+                    sys.stdout.flush()
+        else:
+            for fn, a in ops:
+                fn(*a)
+    finally:
+        pyautogui.PAUSE = pause
+
+    # One write for the whole log instead of a print per step
+    if actions:
+        sys.stdout.write("Executed:\n  " + "\n  ".join(actions) + "\n")
+        sys.stdout.flush()
@@ -3,10 +3,17 @@
 Workflow Parser - Converts session_summary.json to automation-ready workflow steps
 """
 
-import json
+import re
 from typing import List, Dict, Any
 from pathlib import Path
 
+from modules.storage.data_manager import read_session_summary
+from modules.storage.json_utils import DECODE_ERRORS, dump_json, load_json_field
+
+# Spoken command word followed by its target, both whole whitespace-separated words;
+# the lookahead lets a target also start the next command ("open close file")
+_VOICE_CMD_RE = re.compile(r'(?<!\S)(open|close|save|delete|create|run)\s+(?=(\S+))')
+
 def parse_summary_to_workflow(summary_file: str) -> List[Dict[str, Any]]:
     """
     Converts session_summary.json to automation steps
@@ -17,13 +24,16 @@ def parse_summary_to_workflow(summary_file: str) -> List[Dict[str, Any]]:
     Returns:
         List of automation workflow steps
     """
+    # Only the analysis is needed up front; the OCR payload is read if inference needs it
     try:
-        with open(summary_file, "r") as f:
-            summary = json.load(f)
+        if str(summary_file).endswith('.jsonl'):
+            summary = read_session_summary(summary_file)
+        else:
+            summary = {"llm_analysis": load_json_field(summary_file, "llm_analysis") or {}}
     except FileNotFoundError:
         print(f"Error: {summary_file} not found")
         return []
-    except json.JSONDecodeError:
+    except DECODE_ERRORS:
         print(f"Error: Invalid JSON in {summary_file}")
         return []
     
@@ -46,6 +56,7 @@ def parse_summary_to_workflow(summary_file: str) -> List[Dict[str, Any]]:
     
     # If no actions detected, try to infer from OCR and transcription
     if not workflow_steps:
+        summary = read_session_summary(summary_file, include_ocr=True)
         workflow_steps = infer_steps_from_session(summary)
     
     return workflow_steps
@@ -192,19 +203,14 @@ def infer_steps_from_session(summary: Dict[str, Any]) -> List[Dict[str, Any]]:
         text = audio_transcription.get("text", "")
         
         # Extract potential commands
-        command_keywords = ["open", "close", "save", "delete", "create", "run"]
-        words = text.lower().split()
-        
-        for i, word in enumerate(words):
-            if word in command_keywords and i + 1 < len(words):
-                target = words[i + 1]
-                steps.append({
-                    "step": step_number,
-                    "action": "execute",
-                    "command": f"{word} {target}",
-                    "description": f"Voice command: {word} {target}"
-                })
-                step_number += 1
+        for word, target in _VOICE_CMD_RE.findall(text.lower()):
+            steps.append({
+                "step": step_number,
+                "action": "execute",
+                "command": f"{word} {target}",
+                "description": f"Voice command: {word} {target}"
+            })
+            step_number += 1
     
     return steps
 
@@ -223,8 +229,7 @@ def save_workflow_json(workflow_steps: List[Dict[str, Any]], output_file: str):
         "generated_from": "workflow_parser.py"
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(workflow_data, f, indent=2)
+    dump_json(workflow_data, output_file)
     
     print(f"Workflow saved to: {output_file}")
 
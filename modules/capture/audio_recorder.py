@@ -1,6 +1,8 @@
 import sounddevice as sd
-from scipy.io.wavfile import write
+import soundfile as sf
 import os
+import queue
+import time
 from datetime import datetime
 
 def record_audio(session_id=None, output_dir="data/clips", duration=15, fs=44100):
@@ -21,9 +23,34 @@ def record_audio(session_id=None, output_dir="data/clips", duration=15, fs=44100
         raise RuntimeError("No available input channels — check your mic settings.")
 
     print("Recording audio...")
-    recording = sd.rec(int(duration * fs), samplerate=fs, channels=channels)
-    sd.wait()
+    # The PortAudio callback only queues a copy of each block; the WAV file is written
+    # from this thread so disk I/O never stalls the real-time audio thread
+    blocks = queue.Queue()
+
+    def callback(indata, frames, time_info, status):
+        blocks.put((indata.copy(), status))
+
+    def write_block(wav, block, status):
+        if status:
+            print(f"⚠️ Audio stream: {status}")
+        wav.write(block)
+
+    # Each block goes straight to the WAV file, so memory stays at a few blocks for any duration
+    with sf.SoundFile(filename, 'w', samplerate=fs, channels=channels, subtype='PCM_16') as wav:
+        with sd.InputStream(samplerate=fs, channels=channels, dtype='int16', callback=callback):
+            deadline = time.monotonic() + duration
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    write_block(wav, *blocks.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+        # The stream is closed now; write whatever was still queued
+        while not blocks.empty():
+            write_block(wav, *blocks.get_nowait())
 
-    write(filename, fs, recording)
     print(f"Saved audio: {filename}")
     return filename
@@ -1,27 +1,73 @@
 from pynput import mouse, keyboard
 import time
+from itertools import count
+
+# Ring buffer size: the oldest events are overwritten once it fills up
+MAX_INPUT_EVENTS = 100000
+
+# Consecutive mouse moves closer together than this replace each other (last move wins)
+MOVE_COALESCE_NS = 10_000_000
 
 def record_input_events(duration=5):
-    events = []
-    start_time = time.time()
+    # Listener callbacks only store small tuples; dicts are built once at the end
+    events = [None] * MAX_INPUT_EVENTS
+    # next() on a count is atomic, so the mouse and keyboard threads never share a slot
+    slots = count()
+    last_slot = [-1]
+    last_move = [-1, 0]  # slot index and time of the most recent move
+    start_wall = time.time()
+    start_ns = time.monotonic_ns()
+
+    def add(event):
+        slot = next(slots)
+        events[slot % MAX_INPUT_EVENTS] = event
+        last_slot[0] = slot
+        return slot
 
     def on_move(x, y):
-        events.append({"type": "move", "pos": (x, y), "time": time.time()})
+        t = time.monotonic_ns()
+        # Only merge into the previous move if nothing else was recorded since
+        if last_slot[0] == last_move[0] and t - last_move[1] < MOVE_COALESCE_NS:
+            events[last_move[0] % MAX_INPUT_EVENTS] = ("move", x, y, t)
+            return
+        last_move[0] = add(("move", x, y, t))
+        last_move[1] = t
 
     def on_click(x, y, button, pressed):
-        events.append({"type": "click", "pos": (x, y), "button": str(button), "pressed": pressed, "time": time.time()})
+        add(("click", x, y, button, pressed, time.monotonic_ns()))
 
     def on_press(key):
-        events.append({"type": "key", "key": str(key), "pressed": True, "time": time.time()})
+        add(("key", key, True, time.monotonic_ns()))
 
     def on_release(key):
-        events.append({"type": "key", "key": str(key), "pressed": False, "time": time.time()})
+        add(("key", key, False, time.monotonic_ns()))
 
     with mouse.Listener(on_move=on_move, on_click=on_click) as ml, \
          keyboard.Listener(on_press=on_press, on_release=on_release) as kl:
-        while time.time() - start_time < duration:
-            time.sleep(0.1)
+        time.sleep(duration)
         ml.stop()
         kl.stop()
 
-    return events
+    # Unroll the ring buffer oldest-first
+    total = next(slots)
+    if total > MAX_INPUT_EVENTS:
+        split = total % MAX_INPUT_EVENTS
+        recorded = events[split:] + events[:split]
+    else:
+        recorded = events[:total]
+
+    def wall_time(t):
+        return start_wall + (t - start_ns) / 1e9
+
+    result = []
+    for event in recorded:
+        kind = event[0]
+        if kind == "move":
+            result.append({"type": "move", "pos": (event[1], event[2]), "time": wall_time(event[3])})
+        elif kind == "click":
+            result.append({"type": "click", "pos": (event[1], event[2]), "button": str(event[3]),
+                           "pressed": event[4], "time": wall_time(event[5])})
+        else:
+            result.append({"type": "key", "key": str(event[1]), "pressed": event[2], "time": wall_time(event[3])})
+
+    return result
@@ -1,25 +1,73 @@
 from mss import mss
+from mss.tools import to_png
 import time, os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def capture_screenshots(session_id=None, output_dir="data/clips", interval=3, duration=15):
+# zlib level for screenshots: level 1 encodes ~3x faster than the default 6 for a slightly bigger file
+PNG_COMPRESSION_LEVEL = 1
+
+def _save_png(img, filename):
+    # BGRA -> RGB conversion happens here too, off the capture thread
+    to_png(img.rgb, img.size, level=PNG_COMPRESSION_LEVEL, output=filename)
+    print("Saved:", filename)
+
+def _store_png(img, archive, member, filename):
+    # PNG data is already compressed, so the archive only stores it (ZipFile.writestr is locked)
+    archive.writestr(member, to_png(img.rgb, img.size, level=PNG_COMPRESSION_LEVEL))
+    print("Saved:", filename)
+
+def capture_screenshots(session_id=None, output_dir="data/clips", interval=3, duration=15, archive=False):
+    """
+    Capture screenshots at a fixed interval
+
+    By default every frame is its own PNG file. With archive=True all frames go into one
+    screenshots_<id>.zip instead (one file create per session rather than one per frame) and
+    the returned paths look like "<zip path>/<member>.png" - not real files, but
+    ocr_processor reads them straight from the archive.
+    """
     os.makedirs(output_dir, exist_ok=True)
     sct = mss()
     start_time = time.time()
     count = 0
     screenshot_paths = []  # ✅ store file paths
+    monitor = sct.monitors[1]
+
+    # Grab on this thread, PNG-encode and write in the background so the capture cadence stays steady
+    encoder = ThreadPoolExecutor(max_workers=2)
+    pending = []
+
+    # Build the path prefix once; the counter keeps names unique and in capture order
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    name = f"{session_id}_{timestamp}" if session_id else timestamp
+    if archive:
+        zip_path = os.path.join(output_dir, f"screenshots_{name}.zip")
+        zf = zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED)
+        prefix = f"{zip_path}/shot_"
+    else:
+        zf = None
+        prefix = os.path.join(output_dir, f"screenshot_{name}_")
+
+    try:
+        while time.time() - start_time < duration:
+            filename = f"{prefix}{count:05d}.png"
+
+            img = sct.grab(monitor)
+            if zf is not None:
+                pending.append(encoder.submit(_store_png, img, zf, f"shot_{count:05d}.png", filename))
+            else:
+                pending.append(encoder.submit(_save_png, img, filename))
+            screenshot_paths.append(filename)  # ✅ keep track of saved file
+            count += 1
+            time.sleep(interval)
 
-    while time.time() - start_time < duration:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if session_id:
-            filename = os.path.join(output_dir, f"screenshot_{session_id}_{timestamp}_{count}.png")
-        else:
-            filename = os.path.join(output_dir, f"screenshot_{timestamp}_{count}.png")
-
-        sct.shot(output=filename)
-        print("Saved:", filename)
-        screenshot_paths.append(filename)  # ✅ keep track of saved file
-        count += 1
-        time.sleep(interval)
+        # Make sure every file is on disk before callers read them
+        for future in pending:
+            future.result()
+    finally:
+        encoder.shutdown()
+        if zf is not None:
+            zf.close()
 
     return screenshot_paths  # ✅ return the list
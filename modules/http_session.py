@@ -0,0 +1,22 @@
+# modules/http_session.py
+"""
+Shared HTTP session - keeps connections to the local Ollama server alive between calls
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Used when a call doesn't pass its own timeout
+DEFAULT_TIMEOUT = 10
+
+class _Session(requests.Session):
+    """requests.Session that applies DEFAULT_TIMEOUT to every request"""
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+session = _Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
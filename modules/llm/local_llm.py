@@ -5,10 +5,32 @@ Supports: Ollama, LLaMA.cpp, or fallback to rule-based analysis
 """
 
 import json
-import requests
-from typing import Dict, Any, List
+import re
+from collections import Counter
+from typing import Dict, Any, List, Callable, Optional
 from pathlib import Path
 
+from modules.http_session import session
+
+# Rule-based replies, first matching pattern wins
+_RULES = [
+    (re.compile(r'summar(?:y|ize)'), "User performed desktop activities including screen navigation and possible application usage."),
+    (re.compile(r'actions'), "Detected actions: Screen viewing, potential clicking, and keyboard interaction."),
+    (re.compile(r'automation'), "This workflow shows potential for automation if repetitive patterns are confirmed in future sessions."),
+]
+_RULES_DEFAULT = "Analysis completed using rule-based system. Install Ollama for advanced LLM analysis."
+
+# End of a sentence inside streamed text
+_SENTENCE_END_RE = re.compile(r'[.!?](?=\s)')
+
+def has_lines(text: str, n: int) -> bool:
+    """True once text holds n finished lines"""
+    return text.count('\n') >= n
+
+def has_sentences(text: str, n: int) -> bool:
+    """True once text holds n finished sentences"""
+    return len(_SENTENCE_END_RE.findall(text)) >= n
+
 class LocalLLM:
     def __init__(self, backend: str = "ollama", model: str = "phi3:latest"):
         """
@@ -21,56 +43,77 @@ class LocalLLM:
         self.backend = backend
         self.model = model
         self.ollama_url = "http://localhost:11434/api/generate"
+        
+        # Request fields that are the same for every prompt
+        self._request_base = {
+            "model": self.model,
+            "stream": True,
+            "options": {
+                "temperature": 0.3,
+                "num_predict": 500
+            }
+        }
+        
+        # Result of the first availability check, reused afterwards
+        self._available = None
 
     
     def is_available(self) -> bool:
         """Check if LLM backend is available"""
+        if self._available is None:
+            self._available = self._check_available()
+        return self._available
+    
+    def _check_available(self) -> bool:
+        """Probe the LLM backend"""
         if self.backend == "ollama":
             try:
-                response = requests.get("http://localhost:11434/api/tags", timeout=2)
+                response = session.get("http://localhost:11434/api/tags", timeout=2)
                 return response.status_code == 200
             except:
                 return False
         return True
     
-    def generate(self, prompt: str) -> str:
+    def generate(self, prompt: str, done: Optional[Callable[[str], bool]] = None) -> str:
         """
         Generate response from LLM
         
         Args:
             prompt: Input prompt
+            done: Called with the text so far; returning True stops the generation early
         
         Returns:
             Generated text
         """
         if self.backend == "ollama":
-            return self._generate_ollama(prompt)
+            return self._generate_ollama(prompt, done)
         else:
             return self._generate_rules_based(prompt)
     
-    def _generate_ollama(self, prompt: str) -> str:
-        """Generate using Ollama"""
+    def _generate_ollama(self, prompt: str, done: Optional[Callable[[str], bool]] = None) -> str:
+        """Generate using Ollama, reading the streamed chunks until the model or `done` says stop"""
         try:
-            response = requests.post(
+            # Leaving the block closes the connection, which makes Ollama stop generating
+            with session.post(
                 self.ollama_url,
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,
-                        "num_predict": 500
-                    }
-                },
-                timeout=30
-            )
+                json={**self._request_base, "prompt": prompt},
+                timeout=30,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    print(f"   ⚠️  Ollama error: {response.status_code} -> {response.text}")
+                    return self._generate_rules_based(prompt)
+                
+                text = ""
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    text += chunk.get("response", "")
+                    if chunk.get("done") or (done and done(text)):
+                        break
             
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("response", "").strip() or "No meaningful response from model."
-            else:
-                print(f"   ⚠️  Ollama error: {response.status_code} -> {response.text}")
-                return self._generate_rules_based(prompt)
+            return text.strip() or "No meaningful response from model."
         
         except Exception as e:
             print(f"   ⚠️  Ollama connection failed: {e}")
@@ -81,14 +124,16 @@ class LocalLLM:
         # Simple keyword-based analysis
         prompt_lower = prompt.lower()
         
-        if "summarize" in prompt_lower or "summary" in prompt_lower:
-            return "User performed desktop activities including screen navigation and possible application usage."
-        elif "actions" in prompt_lower:
-            return "Detected actions: Screen viewing, potential clicking, and keyboard interaction."
-        elif "automation" in prompt_lower:
-            return "This workflow shows potential for automation if repetitive patterns are confirmed in future sessions."
-        else:
-            return "Analysis completed using rule-based system. Install Ollama for advanced LLM analysis."
+        for pattern, reply in _RULES:
+            if pattern.search(prompt_lower):
+                return reply
+        return _RULES_DEFAULT
+
+# Below this much context the LLM is skipped in favour of the rule-based answers
+MIN_LLM_CONTEXT_CHARS = 80
+
+# Separates the summary from the suggestions in the combined prompt's answer
+SECTION_SEPARATOR = "==="
 
 def analyze_session_with_llm(session_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -109,14 +154,35 @@ def analyze_session_with_llm(session_data: Dict[str, Any]) -> Dict[str, Any]:
         print("   ⚠️  Ollama not available. Using rule-based analysis.")
         print("   💡 Install Ollama (https://ollama.ai) for better results!")
     
+    # Flatten UI elements once; the helpers below would each re-walk the OCR results
+    ui_elements = collect_ui_elements(session_data)
+    
     # Prepare context for LLM
-    context = prepare_context_for_llm(session_data)
+    context = prepare_context_for_llm(session_data, ui_elements)
+    
+    # Sessions with next to no captured text gain nothing from the model;
+    # the rule-based answers are instant
+    transcription = session_data.get('audio_transcription', {})
+    low_signal = (len(context) < MIN_LLM_CONTEXT_CHARS or
+                  (not session_data.get('ocr_results') and not transcription.get('success')))
+    if llm.backend == "ollama" and (low_signal or not llm.is_available()):
+        if low_signal and llm.is_available():
+            print("   ℹ️  Too little context captured for the LLM. Using rule-based analysis.")
+        llm.backend = "rules"
     
     # Generate analysis
     analysis = {}
     
-    # 1. Workflow Summary
-    print("   Analyzing workflow...")
+    # 1. Detect Actions
+    print("   Detecting actions...")
+    actions = detect_actions_from_session(session_data, ui_elements)
+    
+    # 2. Detect Patterns
+    print("   Analyzing patterns...")
+    patterns = detect_patterns(session_data, actions)
+    
+    # 3. Workflow Summary & Automation Suggestions
+    print("   Analyzing workflow and generating automation suggestions...")
     summary_prompt = f"""Analyze this desktop session and provide a brief summary of what the user did.
 
 Context:
@@ -124,20 +190,6 @@ Context:
 
 Provide a concise 2-3 sentence summary of the user's workflow."""
     
-    analysis['workflow_summary'] = llm.generate(summary_prompt)
-    
-    # 2. Detect Actions
-    print("   Detecting actions...")
-    actions = detect_actions_from_session(session_data)
-    analysis['detected_actions'] = actions
-    
-    # 3. Detect Patterns
-    print("   Analyzing patterns...")
-    patterns = detect_patterns(session_data, actions)
-    analysis['detected_patterns'] = patterns
-    
-    # 4. Automation Suggestions
-    print("   Generating automation suggestions...")
     automation_prompt = f"""Based on this desktop session, suggest how it could be automated.
 
 Context:
@@ -147,11 +199,38 @@ Actions detected: {', '.join(actions[:5])}
 
 Provide 2-3 specific automation suggestions."""
     
-    suggestions_text = llm.generate(automation_prompt)
+    summary = suggestions_text = None
+    if llm.backend == "ollama":
+        # Ask for both in one generation and split on the separator line
+        combined_prompt = f"""Analyze this desktop session.
+
+Context:
+{context}
+
+Actions detected: {', '.join(actions[:5])}
+
+First give a concise 2-3 sentence summary of the user's workflow.
+Then write a line containing only {SECTION_SEPARATOR} followed by 2-3 specific automation suggestions, one per line."""
+        
+        # Stop once the third suggestion line is finished
+        response = llm.generate(
+            combined_prompt,
+            done=lambda text: SECTION_SEPARATOR in text and has_lines(text.split(SECTION_SEPARATOR, 1)[1].lstrip(), 3)
+        )
+        if SECTION_SEPARATOR in response:
+            summary, suggestions_text = (part.strip() for part in response.split(SECTION_SEPARATOR, 1))
+    
+    if summary is None:
+        summary = llm.generate(summary_prompt, done=lambda text: has_sentences(text, 3))
+        suggestions_text = llm.generate(automation_prompt, done=lambda text: has_lines(text, 3))
+    
+    analysis['workflow_summary'] = summary
+    analysis['detected_actions'] = actions
+    analysis['detected_patterns'] = patterns
     analysis['automation_suggestions'] = suggestions_text.split('\n')[:3]
     
     # 5. Calculate Automation Potential
-    potential = calculate_automation_potential(session_data, actions, patterns)
+    potential = calculate_automation_potential(session_data, actions, patterns, len(ui_elements))
     analysis['automation_potential'] = potential
     
     # 6. Generate Automation Steps (if high potential)
@@ -169,7 +248,14 @@ Provide 2-3 specific automation suggestions."""
     
     return analysis
 
-def prepare_context_for_llm(session_data: Dict[str, Any]) -> str:
+def collect_ui_elements(session_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Gather the UI elements detected across all screenshots"""
+    ui_elements = []
+    for ocr in session_data.get('ocr_results', []):
+        ui_elements.extend(ocr.get('ui_elements', []))
+    return ui_elements
+
+def prepare_context_for_llm(session_data: Dict[str, Any], ui_elements: List[Dict] = None) -> str:
     """Prepare concise context for LLM"""
     context_parts = []
     
@@ -185,27 +271,25 @@ def prepare_context_for_llm(session_data: Dict[str, Any]) -> str:
         context_parts.append(f"User said: {transcription.get('text', '')[:300]}")
     
     # UI elements
-    ui_elements = []
-    for ocr in ocr_results:
-        ui_elements.extend(ocr.get('ui_elements', []))
+    if ui_elements is None:
+        ui_elements = collect_ui_elements(session_data)
     if ui_elements:
         context_parts.append(f"UI elements detected: {len(ui_elements)}")
     
     return '\n'.join(context_parts)
 
-def detect_actions_from_session(session_data: Dict[str, Any]) -> List[str]:
+def detect_actions_from_session(session_data: Dict[str, Any], ui_elements: List[Dict] = None) -> List[str]:
     """Detect user actions from session data"""
     actions = []
     
     # From OCR - detect UI interactions
-    ocr_results = session_data.get('ocr_results', [])
-    for ocr in ocr_results:
-        ui_elements = ocr.get('ui_elements', [])
-        for element in ui_elements:
-            if element['type'] == 'button':
-                actions.append(f"Clicked button: {element['text']}")
-            elif element['type'] == 'input':
-                actions.append(f"Interacted with input: {element['text']}")
+    if ui_elements is None:
+        ui_elements = collect_ui_elements(session_data)
+    for element in ui_elements:
+        if element['type'] == 'button':
+            actions.append(f"Clicked button: {element['text']}")
+        elif element['type'] == 'input':
+            actions.append(f"Interacted with input: {element['text']}")
     
     # From audio - detect voice commands
     transcription = session_data.get('audio_transcription', {})
@@ -230,10 +314,7 @@ def detect_patterns(session_data: Dict[str, Any], actions: List[str]) -> List[st
     patterns = []
     
     # Check for repeated actions
-    action_types = {}
-    for action in actions:
-        action_type = action.split(':')[0]
-        action_types[action_type] = action_types.get(action_type, 0) + 1
+    action_types = Counter(action.split(':', 1)[0] for action in actions)
     
     for action_type, count in action_types.items():
         if count >= 2:
@@ -248,7 +329,8 @@ def detect_patterns(session_data: Dict[str, Any], actions: List[str]) -> List[st
 
 def calculate_automation_potential(session_data: Dict[str, Any], 
                                    actions: List[str], 
-                                   patterns: List[str]) -> int:
+                                   patterns: List[str],
+                                   total_ui_elements: int = None) -> int:
     """Calculate automation potential (0-10)"""
     score = 0
     
@@ -262,8 +344,8 @@ def calculate_automation_potential(session_data: Dict[str, Any],
     score += min(len(patterns), 2)
     
     # Bonus for UI element detection
-    ocr_results = session_data.get('ocr_results', [])
-    total_ui_elements = sum(len(ocr.get('ui_elements', [])) for ocr in ocr_results)
+    if total_ui_elements is None:
+        total_ui_elements = len(collect_ui_elements(session_data))
     if total_ui_elements >= 5:
         score += 2
     elif total_ui_elements >= 2:
@@ -1,5 +1,12 @@
 import subprocess
 import os
+import re
+
+# Command keywords, matched as whole words so "closest" doesn't count as "close"
+_CMD_RE = re.compile(
+    r'\b(open|close|click|save|search|start|stop|run|analyze|record'
+    r'|delete|copy|move|upload|download)\b'
+)
 
 def transcribe_audio(audio_file):
     """
@@ -14,34 +21,28 @@ def transcribe_audio(audio_file):
         raise FileNotFoundError(f"Model not found at {model_path}")
 
     try:
-        # Run whisper.cpp command and capture stdout/stderr
+        # -nt prints the plain transcript to stdout; no .txt sidecar is written or read back
         result = subprocess.run(
-            [whisper_bin, "-m", model_path, "-f", audio_file, "-otxt"],
+            [whisper_bin, "-m", model_path, "-f", audio_file, "-nt", "-np"],
             capture_output=True,
             text=True,
             check=True
         )
 
-        transcript = result.stdout.strip()
-
-        # Whisper sometimes writes text to a .txt file instead of stdout
-        txt_file = audio_file.replace(".wav", ".txt")
-        if os.path.exists(txt_file):
-            with open(txt_file, "r") as f:
-                transcript = f.read().strip()
+        transcript = " ".join(line.strip() for line in result.stdout.splitlines() if line.strip())
 
         # Handle blank or empty transcriptions
         if not transcript or "[BLANK_AUDIO]" in transcript:
             return {
                 "success": False,
                 "text": "[BLANK_AUDIO]",
-                "file": txt_file if os.path.exists(txt_file) else None
+                "file": None
             }
 
         return {
             "success": True,
             "text": transcript,
-            "file": txt_file if os.path.exists(txt_file) else None
+            "file": None
         }
 
     except subprocess.CalledProcessError as e:
@@ -60,20 +61,6 @@ def extract_commands_from_transcription(transcription_text: str):
     if not transcription_text or not isinstance(transcription_text, str):
         return []
 
-    actions = []
-
-    # Basic keyword-based detection (you can expand this later)
-    keywords = [
-        "open", "close", "click", "save", "search",
-        "start", "stop", "run", "analyze", "record",
-        "delete", "copy", "move", "upload", "download"
-    ]
-
-    text_lower = transcription_text.lower()
-
-    for word in keywords:
-        if word in text_lower:
-            actions.append(f"Detected command: '{word}'")
-
-    # Remove duplicates and return
-    return list(set(actions))
+    # One regex pass; dict.fromkeys drops repeats but keeps first-seen order
+    commands = dict.fromkeys(_CMD_RE.findall(transcription_text.lower()))
+    return [f"Detected command: '{word}'" for word in commands]
@@ -3,12 +3,19 @@
 Data Manager - Handles storage optimization and cleanup
 """
 
+import errno
+import fnmatch
 import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List
-import json
+from typing import Any, Dict, List, Tuple, Union
+
+from modules.storage.json_utils import dump_json, dumps, loads, load_json, load_json_scalars_and_count
 
 def get_file_size(file_path: Path) -> int:
     """Get file size in bytes"""
@@ -17,67 +24,176 @@ def get_file_size(file_path: Path) -> int:
     except:
         return 0
 
+# Subdirectories of data/ covered by storage stats and cleanup
+STORAGE_AREAS = ("clips", "json", "workflows")
+
+@dataclass(frozen=True)
+class DataLayout:
+    """Paths of the data directory and its storage areas, built once per root"""
+    __slots__ = ('root', 'clips', 'json', 'workflows')
+    
+    root: Path
+    clips: Path
+    json: Path
+    workflows: Path
+    
+    @classmethod
+    def from_root(cls, data_dir: Union[str, Path]) -> 'DataLayout':
+        """Layout for a data directory (cached, so repeated calls share one instance)"""
+        return _layout_for(str(data_dir))
+    
+    @property
+    def areas(self) -> Tuple[Tuple[str, Path], ...]:
+        """(area name, path) pairs in STORAGE_AREAS order"""
+        return (("clips", self.clips), ("json", self.json), ("workflows", self.workflows))
+
+@lru_cache(maxsize=None)
+def _layout_for(data_dir: str) -> DataLayout:
+    root = Path(data_dir)
+    return DataLayout(root, root / "clips", root / "json", root / "workflows")
+
+def as_layout(data_dir: Union[str, Path, DataLayout]) -> DataLayout:
+    """Accept either a DataLayout or a plain data directory path"""
+    if isinstance(data_dir, DataLayout):
+        return data_dir
+    return DataLayout.from_root(data_dir)
+
+# File name patterns, compiled once instead of on every glob
+WORKFLOW_FILE_RE = re.compile(fnmatch.translate('workflow_*.json'))
+SESSION_SUMMARY_RE = re.compile(r'session_summary_.*\.jsonl?\Z')
+
 def get_directory_size(directory: Path) -> int:
     """Get total size of directory in bytes"""
     total_size = 0
     try:
-        for item in directory.rglob('*'):
-            if item.is_file():
-                total_size += get_file_size(item)
+        # scandir entries carry the stat result, no second lookup per file
+        for _, _, _, size, _, _ in _walk_scandir(directory, None):
+            total_size += size
     except Exception as e:
         print(f"Error calculating directory size: {e}")
     return total_size
 
-def get_storage_info(data_dir: Path) -> Dict:
+def _walk_scandir(directory, area, top_level=True):
+    """Yield (area, path, name, size, mtime, top_level) for every file below directory"""
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_scandir(entry.path, area, top_level=False)
+                elif entry.is_file(follow_symlinks=False):
+                    st = entry.stat()
+                    yield (area, entry.path, entry.name, st.st_size, st.st_mtime, top_level)
+    except FileNotFoundError:
+        return
+
+def _scan_area(area_path: Tuple[str, Path]) -> List[tuple]:
+    """Walk one storage area into a list"""
+    area, path = area_path
+    return list(_walk_scandir(path, area))
+
+def scan_data_dir(data_dir: Union[Path, DataLayout], max_workers: int = len(STORAGE_AREAS)) -> List[tuple]:
+    """
+    Walk the storage areas of the data directory once
+    
+    Args:
+        data_dir: Path to data directory (or its DataLayout)
+        max_workers: Areas walked concurrently (1 walks them one after another)
+    
+    Returns:
+        List of (area, path, name, size, mtime, top_level) tuples that
+        get_storage_info and cleanup_old_data can share
+    """
+    areas = as_layout(data_dir).areas
+    if max_workers <= 1:
+        walks = [_scan_area(area) for area in areas]
+    else:
+        # scandir/stat release the GIL, so the areas' syscalls overlap
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            walks = list(executor.map(_scan_area, areas))
+    
+    entries = []
+    for walk in walks:
+        entries.extend(walk)
+    return entries
+
+# data_dir -> (area directory mtimes, storage info) from the last full scan
+_STORAGE_CACHE = {}
+
+def _areas_mtime_key(layout: DataLayout) -> tuple:
+    """mtimes of the storage area directories; they change whenever a file is added or removed"""
+    key = []
+    for _, path in layout.areas:
+        try:
+            key.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            key.append(None)
+    return tuple(key)
+
+def get_storage_info(data_dir: Union[Path, DataLayout], entries: List[tuple] = None) -> Dict:
     """
     Get storage information for data directory
     
     Args:
-        data_dir: Path to data directory
+        data_dir: Path to data directory (or its DataLayout)
+        entries: Result of scan_data_dir, to reuse an earlier walk
     
     Returns:
         Dictionary with storage statistics
     """
-    clips_dir = data_dir / "clips"
-    json_dir = data_dir / "json"
-    workflows_dir = data_dir / "workflows"
+    # Reuse the last result while no area directory has gained or lost files
+    # (a file growing in place doesn't change its directory's mtime)
+    layout = as_layout(data_dir)
+    cache_key = layout.root
+    mtimes = _areas_mtime_key(layout)
+    if entries is None:
+        cached = _STORAGE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtimes:
+            return dict(cached[1])
+        entries = scan_data_dir(layout)
+    
+    sizes = dict.fromkeys(STORAGE_AREAS, 0)
+    counts = dict.fromkeys(STORAGE_AREAS, 0)
+    
+    for area, _, name, size, _, top_level in entries:
+        sizes[area] += size
+        if not top_level:
+            continue
+        if area == "clips" or name.endswith(('.json', '.jsonl')):
+            counts[area] += 1
     
     info = {
-        'clips_size_mb': get_directory_size(clips_dir) / (1024 * 1024),
-        'json_size_mb': get_directory_size(json_dir) / (1024 * 1024),
-        'workflows_size_mb': get_directory_size(workflows_dir) / (1024 * 1024),
+        'clips_size_mb': sizes['clips'] / (1024 * 1024),
+        'json_size_mb': sizes['json'] / (1024 * 1024),
+        'workflows_size_mb': sizes['workflows'] / (1024 * 1024),
         'total_size_mb': 0,
         'file_count': 0,
-        'clips_count': 0,
-        'json_count': 0,
-        'workflows_count': 0
+        'clips_count': counts['clips'],
+        'json_count': counts['json'],
+        'workflows_count': counts['workflows']
     }
     
-    # Count files
-    try:
-        info['clips_count'] = len(list(clips_dir.glob('*')))
-        info['json_count'] = len(list(json_dir.glob('*.json')))
-        info['workflows_count'] = len(list(workflows_dir.glob('*.json')))
-        info['file_count'] = info['clips_count'] + info['json_count'] + info['workflows_count']
-    except:
-        pass
-    
+    info['file_count'] = info['clips_count'] + info['json_count'] + info['workflows_count']
     info['total_size_mb'] = info['clips_size_mb'] + info['json_size_mb'] + info['workflows_size_mb']
     
+    _STORAGE_CACHE[cache_key] = (mtimes, dict(info))
     return info
 
-def cleanup_old_data(data_dir: Path, days_to_keep: int = 7) -> Dict:
+def cleanup_old_data(data_dir: Union[Path, DataLayout], days_to_keep: int = 7, entries: List[tuple] = None) -> Dict:
     """
     Clean up old data files
     
     Args:
-        data_dir: Path to data directory
+        data_dir: Path to data directory (or its DataLayout)
         days_to_keep: Keep files from last N days
+        entries: Result of scan_data_dir, to reuse an earlier walk
     
     Returns:
         Cleanup statistics
     """
-    cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+    cutoff = (datetime.now() - timedelta(days=days_to_keep)).timestamp()
+    
+    if entries is None:
+        entries = scan_data_dir(data_dir)
     
     stats = {
         'files_deleted': 0,
@@ -85,35 +201,17 @@ def cleanup_old_data(data_dir: Path, days_to_keep: int = 7) -> Dict:
         'errors': []
     }
     
-    # Clean clips directory
-    clips_dir = data_dir / "clips"
-    if clips_dir.exists():
-        for file_path in clips_dir.glob('*'):
+    # Old clips and session summaries go; workflows are never deleted automatically
+    for area, path, name, size, mtime, top_level in entries:
+        if not top_level or mtime >= cutoff:
+            continue
+        if area == "clips" or (area == "json" and SESSION_SUMMARY_RE.match(name)):
             try:
-                file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if file_time < cutoff_date:
-                    size_mb = get_file_size(file_path) / (1024 * 1024)
-                    file_path.unlink()
-                    stats['files_deleted'] += 1
-                    stats['space_freed_mb'] += size_mb
+                os.unlink(path)
+                stats['files_deleted'] += 1
+                stats['space_freed_mb'] += size / (1024 * 1024)
             except Exception as e:
-                stats['errors'].append(f"Error deleting {file_path.name}: {e}")
-    
-    # Clean old JSON summaries (but keep recent ones)
-    json_dir = data_dir / "json"
-    if json_dir.exists():
-        for file_path in json_dir.glob('session_summary_*.json'):
-            try:
-                file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if file_time < cutoff_date:
-                    size_mb = get_file_size(file_path) / (1024 * 1024)
-                    file_path.unlink()
-                    stats['files_deleted'] += 1
-                    stats['space_freed_mb'] += size_mb
-            except Exception as e:
-                stats['errors'].append(f"Error deleting {file_path.name}: {e}")
-    
-    # Never delete workflows automatically
+                stats['errors'].append(f"Error deleting {name}: {e}")
     
     print(f"   Deleted {stats['files_deleted']} files, freed {stats['space_freed_mb']:.2f} MB")
     if stats['errors']:
@@ -121,6 +219,65 @@ def cleanup_old_data(data_dir: Path, days_to_keep: int = 7) -> Dict:
     
     return stats
 
+def write_session_summary(summary_path: Path, session_data: Dict[str, Any],
+                          llm_analysis: Dict[str, Any]):
+    """
+    Write a session summary as newline-delimited JSON
+    
+    Line 1 is the session header, line 2 the LLM analysis, then one line
+    per OCR result, so readers that only need the metadata stop early.
+    
+    Args:
+        summary_path: Output .jsonl path
+        session_data: Session data including OCR results
+        llm_analysis: LLM analysis of the session
+    """
+    header = {k: v for k, v in session_data.items() if k != 'ocr_results'}
+    header['type'] = 'header'
+    header['n_screenshots'] = len(session_data.get('screenshots', []))
+    
+    with open(summary_path, 'wb') as f:
+        f.write(dumps(header, default=str, newline=True))
+        f.write(dumps({'type': 'analysis', 'llm_analysis': llm_analysis}, default=str, newline=True))
+        for result in session_data.get('ocr_results', []):
+            f.write(dumps({'type': 'ocr', **result}, default=str, newline=True))
+
+def read_session_summary(summary_path: Path, include_ocr: bool = False) -> Dict[str, Any]:
+    """
+    Read a session summary in either the .jsonl or the older .json format
+    
+    Args:
+        summary_path: Path to session summary file
+        include_ocr: Also load the per-screenshot OCR records
+    
+    Returns:
+        Dictionary with 'session_data' and 'llm_analysis'
+    """
+    if not str(summary_path).endswith('.jsonl'):
+        return load_json(summary_path)
+    
+    session_data, llm_analysis = {}, {}
+    ocr_results = []
+    
+    with open(summary_path, 'rb') as f:
+        for line in f:
+            record = loads(line)
+            record_type = record.pop('type', None)
+            
+            if record_type == 'header':
+                session_data = record
+            elif record_type == 'analysis':
+                llm_analysis = record.get('llm_analysis', {})
+                if not include_ocr:
+                    break
+            elif record_type == 'ocr':
+                ocr_results.append(record)
+    
+    if include_ocr:
+        session_data['ocr_results'] = ocr_results
+    
+    return {'session_data': session_data, 'llm_analysis': llm_analysis}
+
 def optimize_json_storage(json_file: Path, max_size_kb: int = 500) -> bool:
     """
     Optimize JSON file by removing unnecessary data
@@ -133,11 +290,11 @@ def optimize_json_storage(json_file: Path, max_size_kb: int = 500) -> bool:
         True if optimization was performed
     """
     try:
-        if get_file_size(json_file) / 1024 < max_size_kb:
+        if os.path.getsize(json_file) < max_size_kb * 1024:
             return False
         
-        with open(json_file, 'r') as f:
-            data = json.load(f)
+        data = load_json(json_file)
+        trimmed = False
         
         # Remove verbose data
         if 'session_data' in data:
@@ -146,18 +303,24 @@ def optimize_json_storage(json_file: Path, max_size_kb: int = 500) -> bool:
             # Limit OCR results
             if 'ocr_results' in session:
                 for ocr in session['ocr_results']:
-                    if 'words_with_positions' in ocr:
-                        ocr['words_with_positions'] = ocr['words_with_positions'][:20]
+                    words = ocr.get('words_with_positions')
+                    if words is not None and len(words) > 20:
+                        ocr['words_with_positions'] = words[:20]
+                        trimmed = True
             
             # Limit audio segments
-            if 'audio_transcription' in session:
-                if 'segments' in session['audio_transcription']:
-                    session['audio_transcription']['segments'] = \
-                        session['audio_transcription']['segments'][:10]
+            segments = session.get('audio_transcription', {}).get('segments')
+            if segments is not None and len(segments) > 10:
+                session['audio_transcription']['segments'] = segments[:10]
+                trimmed = True
+        
+        # Nothing to cut: leave the file alone instead of re-serializing it unchanged
+        if not trimmed:
+            return False
         
-        # Save optimized version
-        with open(json_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Save optimized version compactly (no indentation whitespace);
+        # the rename keeps the original intact if the write fails
+        dump_json(data, json_file, indent=False, atomic=True)
         
         return True
     
@@ -180,21 +343,36 @@ def get_workflow_summary(workflows_dir: Path) -> List[Dict]:
     if not workflows_dir.exists():
         return workflows
     
-    for workflow_file in workflows_dir.glob('workflow_*.json'):
-        try:
-            with open(workflow_file, 'r') as f:
-                workflow = json.load(f)
-                workflows.append({
-                    'id': workflow.get('workflow_id'),
-                    'created_at': workflow.get('created_at'),
-                    'steps_count': len(workflow.get('automation_steps', [])),
-                    'file': workflow_file.name
-                })
-        except Exception as e:
-            print(f"Error reading {workflow_file.name}: {e}")
+    with os.scandir(workflows_dir) as it:
+        workflow_files = [entry for entry in it if WORKFLOW_FILE_RE.match(entry.name)]
+    
+    if not workflow_files:
+        return workflows
+    
+    # File reads dominate and release the GIL, so load the files side by side
+    with ThreadPoolExecutor(max_workers=min(8, len(workflow_files))) as executor:
+        for summary in executor.map(_load_workflow_summary, workflow_files):
+            if summary is not None:
+                workflows.append(summary)
     
     return workflows
 
+def _load_workflow_summary(workflow_file: os.DirEntry) -> Dict:
+    """Summarize one workflow file, or None if it can't be read"""
+    try:
+        # Only the header fields and the step count are needed, not the steps
+        workflow, steps_count = load_json_scalars_and_count(workflow_file.path, 'automation_steps')
+    except Exception as e:
+        print(f"Error reading {workflow_file.name}: {e}")
+        return None
+    
+    return {
+        'id': workflow.get('workflow_id'),
+        'created_at': workflow.get('created_at'),
+        'steps_count': steps_count,
+        'file': workflow_file.name
+    }
+
 def archive_old_workflows(workflows_dir: Path, archive_dir: Path = None) -> int:
     """
     Archive workflows older than 30 days
@@ -211,16 +389,28 @@ def archive_old_workflows(workflows_dir: Path, archive_dir: Path = None) -> int:
     
     archive_dir.mkdir(exist_ok=True)
     
-    cutoff_date = datetime.now() - timedelta(days=30)
+    # Compare raw mtimes against one timestamp instead of building a datetime per file
+    cutoff = (datetime.now() - timedelta(days=30)).timestamp()
     archived_count = 0
     
-    for workflow_file in workflows_dir.glob('workflow_*.json'):
-        try:
-            file_time = datetime.fromtimestamp(workflow_file.stat().st_mtime)
-            if file_time < cutoff_date:
-                shutil.move(str(workflow_file), str(archive_dir / workflow_file.name))
-                archived_count += 1
-        except Exception as e:
-            print(f"Error archiving {workflow_file.name}: {e}")
+    # One scandir pass; each entry's stat is fetched once
+    with os.scandir(workflows_dir) as it:
+        for entry in it:
+            if not WORKFLOW_FILE_RE.match(entry.name):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    target = archive_dir / entry.name
+                    # Same filesystem (the default archive dir): a single rename; replace
+                    # overwrites an earlier archived copy on Windows too, like shutil.move did
+                    try:
+                        os.replace(entry.path, target)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        shutil.move(entry.path, target)
+                    archived_count += 1
+            except Exception as e:
+                print(f"Error archiving {entry.name}: {e}")
     
     return archived_count
\ No newline at end of file
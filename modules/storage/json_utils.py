@@ -0,0 +1,226 @@
+# modules/storage/json_utils.py
+"""
+JSON helpers - uses orjson when installed, falls back to the stdlib json module
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Exceptions raised for malformed JSON by any of the parsers used here
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+DECODE_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Files larger than this are parsed straight from a read-only memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# Files larger than this are streamed with ijson; below it a full parse is faster
+STREAM_THRESHOLD = 1024 * 1024
+
+def loads(data) -> Any:
+    """
+    Parse JSON from bytes or str
+
+    Args:
+        data: Raw JSON document
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable] = None,
+          newline: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+        default: Fallback for objects JSON can't encode natively
+        newline: Terminate the document with a newline (for JSON Lines)
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, default=default, option=option)
+    if indent:
+        text = json.dumps(obj, indent=2, default=default)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), default=default)
+    return (text + '\n' if newline else text).encode('utf-8')
+
+def load_json(path) -> Any:
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        # orjson parses from any buffer, so large files skip the copy into a bytes object
+        if orjson is not None and os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return loads(f.read())
+
+def dump_json(obj: Any, path, indent: bool = True, default: Optional[Callable] = None,
+              atomic: bool = False):
+    """
+    Serialize an object and write it to a JSON file
+
+    Args:
+        obj: Object to serialize
+        path: Output file
+        indent: Pretty-print with 2-space indentation
+        default: Fallback for objects JSON can't encode natively
+        atomic: Write a temporary file and rename it over path, so a crash
+            never leaves a half-written file behind
+    """
+    data = dumps(obj, indent=indent, default=default, newline=True)
+    if not atomic:
+        Path(path).write_bytes(data)
+        return
+
+    tmp_path = f"{path}.tmp"
+    try:
+        Path(tmp_path).write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def should_stream(path) -> bool:
+    """Whether a file is big enough (and ijson available) to parse incrementally"""
+    return ijson is not None and os.path.getsize(path) > STREAM_THRESHOLD
+
+def iter_json_array(path, key: str) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level array one at a time
+
+    Args:
+        path: JSON file containing an object
+        key: Name of the array field
+
+    Returns:
+        Iterator over the array elements
+    """
+    if should_stream(path):
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, f'{key}.item', use_float=True)
+    else:
+        yield from load_json(path).get(key, [])
+
+def preview_json_array(path, key: str, n: int) -> Tuple[List[Any], int]:
+    """
+    Get the first n elements of a top-level array and its length
+
+    Args:
+        path: JSON file containing an object
+        key: Name of the array field
+        n: Number of leading elements to keep
+
+    Returns:
+        Tuple of (first n elements, total element count)
+    """
+    first = []
+    count = 0
+    for item in iter_json_array(path, key):
+        if count < n:
+            first.append(item)
+        count += 1
+    return first, count
+
+def load_json_field(path, key: str) -> Any:
+    """
+    Read one top-level field, streaming past the rest of large files
+
+    Args:
+        path: JSON file containing an object
+        key: Name of the field
+
+    Returns:
+        The field's value, or None if it is missing
+    """
+    if should_stream(path):
+        with open(path, 'rb') as f:
+            return next(ijson.items(f, key, use_float=True), None)
+    return load_json(path).get(key)
+
+def load_json_header(path, stop_key: str) -> Dict[str, Any]:
+    """
+    Read the top-level scalar fields that appear before stop_key
+
+    Args:
+        path: JSON file containing an object
+        stop_key: Field to stop at (typically a large array)
+
+    Returns:
+        Dict of the scalar fields found (the same for streamed and fully parsed files)
+    """
+    header = {}
+    if not should_stream(path):
+        for k, v in load_json(path).items():
+            if k == stop_key:
+                break
+            if not isinstance(v, (dict, list)):
+                header[k] = v
+        return header
+
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == stop_key:
+                break
+            if prefix and '.' not in prefix and event in ('string', 'number', 'boolean', 'null'):
+                header[prefix] = value
+    return header
+
+def load_json_scalars_and_count(path, key: str) -> Tuple[Dict[str, Any], int]:
+    """
+    Read the top-level scalar fields and the length of one array field
+
+    Large files are scanned in a single streaming pass, so the array's
+    elements are counted without being built.
+
+    Args:
+        path: JSON file containing an object
+        key: Name of the array field to count
+
+    Returns:
+        Tuple of (scalar fields, number of elements in the array)
+    """
+    if not should_stream(path):
+        data = load_json(path)
+        items = data.get(key)
+        scalars = {k: v for k, v in data.items() if not isinstance(v, (dict, list))}
+        return scalars, len(items) if isinstance(items, list) else 0
+
+    scalars = {}
+    count = 0
+    item_prefix = f"{key}.item"
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == item_prefix:
+                # Each element opens with start_map/start_array or is a lone scalar
+                if event not in ('end_map', 'end_array', 'map_key'):
+                    count += 1
+            elif prefix and '.' not in prefix and event in ('string', 'number', 'boolean', 'null'):
+                scalars[prefix] = value
+    return scalars, count
@@ -4,12 +4,16 @@ This is a TEMPLATE for Round 2 automation execution.
 Integrates with Computer Use platforms to execute learned workflows.
 """
 
-import json
+import os
 import time
 import pyautogui
 from pathlib import Path
 from typing import List, Dict, Any
 
+from modules.automation.auto_runner import paste_text, split_keys, use_paste
+from modules.storage.data_manager import WORKFLOW_FILE_RE
+from modules.storage.json_utils import DECODE_ERRORS, should_stream, iter_json_array, load_json, load_json_header, load_json_scalars_and_count
+
 class AutomationRunner:
     def __init__(self, workflow_file: str):
         """
@@ -19,8 +23,25 @@ class AutomationRunner:
             workflow_file: Path to workflow JSON file
         """
         self.workflow_file = workflow_file
-        self.workflow_data = self.load_workflow()
-        self.automation_steps = self.workflow_data.get('automation_steps', [])
+        
+        # Large recordings are streamed step by step instead of loaded up front
+        self.streaming = self.should_stream()
+        if self.streaming:
+            self.workflow_data = self.load_workflow_header()
+            self.automation_steps = None
+        else:
+            self.workflow_data = self.load_workflow()
+            self.automation_steps = self.workflow_data.get('automation_steps', [])
+            self._prepare_hotkeys(self.automation_steps)
+        
+        # Action name -> handler, built once instead of an if/elif chain per step
+        self._actions = {
+            "click": self._execute_click,
+            "type": self._execute_type,
+            "wait": self._execute_wait,
+            "hotkey": self._execute_hotkey,
+            "execute": self._execute_command,
+        }
         
         # Safety settings for PyAutoGUI
         pyautogui.FAILSAFE = True  # Move mouse to corner to abort
@@ -29,8 +50,31 @@ class AutomationRunner:
     def load_workflow(self) -> Dict[str, Any]:
         """Load workflow from JSON file"""
         try:
-            with open(self.workflow_file, 'r') as f:
-                return json.load(f)
+            return load_json(self.workflow_file)
+        except Exception as e:
+            print(f"Error loading workflow: {e}")
+            return {}
+    
+    @staticmethod
+    def _prepare_hotkeys(steps: List[Dict[str, Any]]):
+        """Split hotkey strings once at load so replays don't re-parse them"""
+        for step in steps:
+            if step.get('action') == 'hotkey':
+                args = step.get('args', {})
+                if args.get('keys'):
+                    args['_key_list'] = split_keys(args['keys'])
+    
+    def should_stream(self) -> bool:
+        """Check whether the workflow file is large enough to stream"""
+        try:
+            return should_stream(self.workflow_file)
+        except OSError:
+            return False
+    
+    def load_workflow_header(self) -> Dict[str, Any]:
+        """Load workflow metadata without parsing the step array"""
+        try:
+            return load_json_header(self.workflow_file, 'automation_steps')
         except Exception as e:
             print(f"Error loading workflow: {e}")
             return {}
@@ -41,16 +85,30 @@ class AutomationRunner:
         
         Args:
             dry_run: If True, only simulate without actual execution
+        
+        Returns:
+            True if every step was read and run, False if nothing or only part of it ran
         """
-        if not self.automation_steps:
+        if not self.streaming and not self.automation_steps:
             print("❌ No automation steps found in workflow")
-            return
+            return False
+        
+        # A streamed file is only parsed as it runs: check it all before the first real click
+        if self.streaming and not dry_run:
+            try:
+                _, steps_count = load_json_scalars_and_count(self.workflow_file, 'automation_steps')
+            except DECODE_ERRORS as e:
+                print(f"❌ Workflow file is corrupt, nothing was executed: {e}")
+                return False
+            if not steps_count:
+                print("❌ No automation steps found in workflow")
+                return False
         
         print("\n" + "="*60)
         print("🤖 AUTOMATION RUNNER - Round 2")
         print("="*60)
         print(f"Workflow: {self.workflow_data.get('workflow_id', 'Unknown')}")
-        print(f"Steps: {len(self.automation_steps)}")
+        print(f"Steps: {'streamed from file' if self.streaming else len(self.automation_steps)}")
         print(f"Mode: {'DRY RUN' if dry_run else 'LIVE EXECUTION'}")
         print("="*60 + "\n")
         
@@ -59,8 +117,25 @@ class AutomationRunner:
             print("💡 Move mouse to top-left corner to abort (FAILSAFE)")
             time.sleep(3)
         
-        for step in self.automation_steps:
-            self.execute_step(step, dry_run)
+        if self.streaming:
+            # Execution starts as soon as the first step is parsed
+            executed = 0
+            try:
+                for step in iter_json_array(self.workflow_file, 'automation_steps'):
+                    self.execute_step(step, dry_run)
+                    executed += 1
+            except DECODE_ERRORS as e:
+                # The file changed since it was checked (or this is a dry run): stop here
+                print(f"\n❌ Workflow file corrupt after step {executed}, stopping: {e}")
+                return False
+            if not executed:
+                print("❌ No automation steps found in workflow")
+                return False
+        else:
+            for step in self.automation_steps:
+                self.execute_step(step, dry_run)
+        
+        return True
     
     def execute_step(self, step: Dict[str, Any], dry_run: bool = False):
         """
@@ -81,21 +156,10 @@ class AutomationRunner:
             return
         
         try:
-            if action == "click":
-                self._execute_click(step)
-            
-            elif action == "type":
-                self._execute_type(step)
-            
-            elif action == "wait":
-                self._execute_wait(step)
-            
-            elif action == "hotkey":
-                self._execute_hotkey(step)
-            
-            elif action == "execute":
-                self._execute_command(step)
+            handler = self._actions.get(action)
             
+            if handler is not None:
+                handler(step)
             else:
                 print(f"   ⚠️  Unknown action type: {action}")
             
@@ -129,14 +193,19 @@ class AutomationRunner:
             print(f"   ⚠️  No text to type")
             return
         
-        print(f"   → Typing: '{text}'")
+        sensitive = args.get('sensitive', False)
+        print(f"   → Typing: '{'*' * len(text) if sensitive else text}'")
         
         # Click at position first if provided
         if 'x' in args and 'y' in args:
             pyautogui.click(args['x'], args['y'])
             time.sleep(0.3)
         
-        pyautogui.write(text, interval=0.05)
+        # Long single-line text is pasted in one shortcut instead of typed at 50 ms per key
+        if use_paste(text, sensitive):
+            paste_text(text)
+        else:
+            pyautogui.write(text, interval=0.05)
     
     def _execute_wait(self, step: Dict[str, Any]):
         """Execute wait action"""
@@ -157,8 +226,8 @@ class AutomationRunner:
         
         print(f"   → Pressing hotkey: {keys}")
         
-        # Parse hotkey string (e.g., "ctrl+s" -> ['ctrl', 's'])
-        key_list = keys.lower().replace(' ', '').split('+')
+        # Parsed at load time; streamed steps are parsed here (e.g., "ctrl+s" -> ('ctrl', 's'))
+        key_list = args.get('_key_list') or split_keys(keys)
         pyautogui.hotkey(*key_list)
     
     def _execute_command(self, step: Dict[str, Any]):
@@ -178,13 +247,26 @@ class AutomationRunner:
         # - Playwright for web apps
         # - OS-specific APIs for system commands
 
+def _iter_workflows(workflows_dir: Path):
+    """Yield a DirEntry for every workflow_*.json file; its stat() result is cached after first use"""
+    with os.scandir(workflows_dir) as it:
+        for entry in it:
+            if WORKFLOW_FILE_RE.match(entry.name):
+                yield entry
+
 def list_available_workflows(workflows_dir: Path = Path("data/workflows")):
-    """List all available workflows"""
+    """
+    List all available workflows
+    
+    Returns:
+        List of (DirEntry, header) tuples; header holds the workflow's top-level
+        fields plus 'steps_count' ({} if the file couldn't be read)
+    """
     if not workflows_dir.exists():
         print("No workflows directory found")
         return []
     
-    workflows = list(workflows_dir.glob("workflow_*.json"))
+    workflows = list(_iter_workflows(workflows_dir))
     
     if not workflows:
         print("No workflows found")
@@ -193,12 +275,12 @@ def list_available_workflows(workflows_dir: Path = Path("data/workflows")):
     print("\n📋 Available Workflows:")
     print("="*60)
     
+    listed = []
     for i, wf in enumerate(workflows, 1):
         try:
-            with open(wf, 'r') as f:
-                data = json.load(f)
-            steps_count = len(data.get('automation_steps', []))
-            workflow_id = data.get('workflow_id', wf.stem)
+            data, steps_count = load_json_scalars_and_count(wf.path, 'automation_steps')
+            data['steps_count'] = steps_count
+            workflow_id = data.get('workflow_id', Path(wf.name).stem)
             created = data.get('created_at', 'Unknown')
             
             print(f"{i}. {wf.name}")
@@ -207,10 +289,12 @@ def list_available_workflows(workflows_dir: Path = Path("data/workflows")):
             print(f"   Created: {created}")
             print()
         except Exception as e:
+            data = {}
             print(f"{i}. {wf.name} (Error loading: {e})")
+        listed.append((wf, data))
     
     print("="*60)
-    return workflows
+    return listed
 
 def main():
     """Main entry point"""
@@ -233,8 +317,10 @@ def main():
         workflow_file = sys.argv[1]
     else:
         # Use most recent workflow
-        workflow_file = max(workflows, key=lambda p: p.stat().st_mtime)
-        print(f"\n▶️  Using most recent workflow: {workflow_file.name}")
+        # DirEntry caches its stat, so each file is stat'ed once
+        latest, _ = max(workflows, key=lambda t: t[0].stat().st_mtime)
+        workflow_file = latest.path
+        print(f"\n▶️  Using most recent workflow: {latest.name}")
     
     # Ask for confirmation
     print("\n" + "="*60)
@@ -257,10 +343,10 @@ def main():
     
     # Run automation
     runner = AutomationRunner(workflow_file)
-    runner.execute_workflow(dry_run=dry_run)
+    completed = runner.execute_workflow(dry_run=dry_run)
     
     print("\n" + "="*60)
-    print("✅ Automation Complete!")
+    print("✅ Automation Complete!" if completed else "❌ Automation did not complete")
     print("="*60 + "\n")
 
 if __name__ == "__main__":
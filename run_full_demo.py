@@ -7,12 +7,17 @@ This script demonstrates the ENTIRE system:
 4. Lets you automate it
 """
 
+import importlib.util
+import os
 import subprocess
 import sys
 import time
 import webbrowser
 from pathlib import Path
 
+from modules.storage.data_manager import WORKFLOW_FILE_RE
+from modules.storage.json_utils import load_json
+
 def print_banner(text):
     """Print a fancy banner"""
     print("\n" + "="*60)
@@ -34,12 +39,12 @@ def check_dependencies():
         'pytesseract': 'PyTesseract'
     }
     
+    # find_spec only locates the package; importing whisper/cv2 here would load torch and native libs
     missing = []
     for module, name in required.items():
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print(f"   ✅ {name}")
-        except ImportError:
+        else:
             print(f"   ❌ {name}")
             missing.append(name)
     
@@ -69,8 +74,13 @@ def run_recording_session():
     print("\n🔴 STARTING RECORDING IN 3 SECONDS...")
     time.sleep(3)
     
-    # Run main.py
-    subprocess.run([sys.executable, "main.py"])
+    # Run main.py in this interpreter: no second Python start-up or module re-import
+    try:
+        from main import main as record_main
+    except ImportError:
+        subprocess.run([sys.executable, "main.py"])
+    else:
+        record_main()
     
     print("\n✅ Recording complete!")
     time.sleep(2)
@@ -82,19 +92,21 @@ def show_results():
     # Find the latest workflow
     workflows_dir = Path("data/workflows")
     
-    if not workflows_dir.exists() or not list(workflows_dir.glob("*.json")):
+    workflows = []
+    if workflows_dir.exists():
+        with os.scandir(workflows_dir) as it:
+            workflows = [entry for entry in it if WORKFLOW_FILE_RE.match(entry.name)]
+    
+    if not workflows:
         print("⚠️  No workflow found. Recording may have failed.")
         return None
     
-    latest_workflow = max(workflows_dir.glob("workflow_*.json"), 
-                         key=lambda p: p.stat().st_mtime)
+    latest_workflow = max(workflows, key=lambda e: e.stat().st_mtime)
     
     print(f"📄 Latest workflow: {latest_workflow.name}")
     
     # Load and display
-    import json
-    with open(latest_workflow, 'r') as f:
-        workflow = json.load(f)
+    workflow = load_json(latest_workflow.path)
     
     print(f"\n📊 Workflow Statistics:")
     print(f"   • ID: {workflow.get('workflow_id')}")
@@ -145,8 +157,13 @@ def launch_dashboard(workflow_id):
     print("\n⚠️  Press Ctrl+C here when done to stop the dashboard")
     print("="*60 + "\n")
     
-    # Start dashboard
-    subprocess.run([sys.executable, "dashboard.py"])
+    # Start dashboard in-process; blocks until Ctrl+C like the old subprocess did
+    try:
+        from dashboard import main as dashboard_main
+    except ImportError:
+        subprocess.run([sys.executable, "dashboard.py"])
+    else:
+        dashboard_main()
 
 def main():
     """Main demo flow"""
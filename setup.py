@@ -3,12 +3,64 @@
 Automated setup script to check dependencies and configure the system
 """
 
+import argparse
+import atexit
+import hashlib
+import http.client
+import importlib.metadata
+import importlib.util
+import itertools
+import json
 import os
+import shutil
+import socket
 import sys
 import subprocess
 import platform
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Default for check_* arguments: no earlier probe result was passed in
+_NOT_PROBED = object()
+
+# Persistent wheel/HTTP cache so re-running setup doesn't download packages again
+PIP_CACHE_DIR = Path.home() / ".cache" / "agi-assistant" / "pip"
+
+# Hash of requirements.txt + Python version from the last successful install
+REQUIREMENTS_STAMP = Path("data/.requirements.sha256")
+
+# Exact versions from the last successful install; re-installs from it need no resolving
+REQUIREMENTS_LOCK = Path("requirements.lock")
+
+# Project name at the start of a requirement line ("numpy>=1.24; python_version...")
+REQUIREMENT_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+# Installer tooling is never pinned in the lock
+LOCK_EXCLUDE = {"pip", "setuptools", "wheel"}
+
+# Full pip output goes here; the terminal only gets a spinner and the result
+PIP_LOG = Path("data/pip_install.log")
+
+# (import name, pip package) pairs the assistant needs
+REQUIRED_MODULES = [
+    ("PIL", "Pillow"),
+    ("numpy", "numpy"),
+    ("cv2", "opencv-python"),
+    ("mss", "mss"),
+    ("sounddevice", "sounddevice"),
+    ("soundfile", "soundfile"),
+    ("whisper", "openai-whisper"),
+    ("pytesseract", "pytesseract"),
+]
+
+# Model names in an Ollama /api/tags body (per-model "details" carry no "name" key)
+OLLAMA_NAME_RE = re.compile(r'"name"\s*:\s*"([^"]+)"')
+
+# Outputs of version probes, keyed by the probed executable's mtime and size
+SETUP_CACHE = Path("data/.setup_cache.json")
+
 class Colors:
     GREEN = '\033[92m'
     YELLOW = '\033[93m'
@@ -17,19 +69,81 @@ class Colors:
     END = '\033[0m'
     BOLD = '\033[1m'
 
+# Output templates, built once instead of on every call
+SEP = f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}\n"
+HEADER_TMPL = "\n" + SEP + f"{Colors.BOLD}{Colors.BLUE}{{text}}{Colors.END}\n" + SEP + "\n"
+SUCCESS_TMPL = f"{Colors.GREEN}✅ {{text}}{Colors.END}\n"
+WARNING_TMPL = f"{Colors.YELLOW}⚠️  {{text}}{Colors.END}\n"
+ERROR_TMPL = f"{Colors.RED}❌ {{text}}{Colors.END}\n"
+TITLE_TMPL = f"\n{Colors.BOLD}{'='*60}\n{{text}}\n{'='*60}{Colors.END}\n\n"
+
+# Colored templates for the terminal; setup.log gets the same text without escape codes
+TEMPLATES = {
+    "header": HEADER_TMPL,
+    "success": SUCCESS_TMPL,
+    "warning": WARNING_TMPL,
+    "error": ERROR_TMPL,
+    "title": TITLE_TMPL,
+    "text": "{text}\n",
+    "prompt": "{text}",
+    "answer": "",  # the terminal already echoes what was typed
+}
+_ANSI_RE = re.compile(r'\033\[[0-9;]*m')
+PLAIN_TEMPLATES = {kind: _ANSI_RE.sub('', tmpl) for kind, tmpl in TEMPLATES.items()}
+PLAIN_TEMPLATES["answer"] = "{text}\n"
+
+# Plain-text copy of the setup report, for CI artifacts and bug reports
+SETUP_LOG = Path("data/setup.log")
+_setup_log = None
+
+def _log_file():
+    """Open setup.log on first use; None if it can't be written"""
+    global _setup_log
+    if _setup_log is None:
+        try:
+            SETUP_LOG.parent.mkdir(parents=True, exist_ok=True)
+            _setup_log = open(SETUP_LOG, "w", encoding="utf-8")
+            atexit.register(_setup_log.close)
+        except OSError:
+            _setup_log = False
+    return _setup_log or None
+
+def _emit_all(entries, flush=False):
+    """
+    Write (kind, text) messages: colored to stdout, plain to setup.log
+    
+    Args:
+        entries: (kind, text) pairs; kind is a key of TEMPLATES
+        flush: Flush both sinks afterwards
+    """
+    sys.stdout.write("".join(TEMPLATES[kind].format(text=text) for kind, text in entries))
+    log = _log_file()
+    if log is not None:
+        log.write("".join(PLAIN_TEMPLATES[kind].format(text=text) for kind, text in entries))
+    if flush:
+        sys.stdout.flush()
+        if log is not None:
+            log.flush()
+
+def _emit(kind, text, flush=False):
+    """Write one message to the terminal and setup.log"""
+    _emit_all(((kind, text),), flush)
+
 def print_header(text):
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}\n")
+    # A header starts a new section, so push everything written so far out now
+    _emit("header", text, flush=True)
 
 def print_success(text):
-    print(f"{Colors.GREEN}✅ {text}{Colors.END}")
+    _emit("success", text)
 
 def print_warning(text):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.END}")
+    _emit("warning", text)
 
 def print_error(text):
-    print(f"{Colors.RED}❌ {text}{Colors.END}")
+    _emit("error", text)
+
+def print_text(text=""):
+    _emit("text", text)
 
 def check_python_version():
     """Check if Python version is compatible"""
@@ -46,16 +160,53 @@ def check_python_version():
         print_error("Python 3.9 or higher is required")
         return False
 
+def _cached_probe(cmd, key):
+    """
+    Run a version probe, reusing the last output while the executable is unchanged
+    
+    Args:
+        cmd: Command to run; cmd[0] is looked up on PATH
+        key: Cache entry name
+    
+    Returns:
+        Tuple of (return code, stdout); raises FileNotFoundError if cmd[0] isn't installed
+    """
+    exe = shutil.which(cmd[0])
+    if exe is None:
+        raise FileNotFoundError(cmd[0])
+    st = os.stat(exe)
+    stamp = [exe, st.st_mtime_ns, st.st_size]
+    
+    try:
+        cache = json.loads(SETUP_CACHE.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    
+    entry = cache.get(key)
+    if entry and entry.get("stamp") == stamp:
+        return entry["returncode"], entry["stdout"]
+    
+    result = subprocess.run([exe] + list(cmd[1:]), capture_output=True, text=True)
+    
+    # Only successes are cached: a failure may be fixed without touching the executable
+    if result.returncode == 0:
+        cache[key] = {"stamp": stamp, "returncode": result.returncode, "stdout": result.stdout}
+        try:
+            SETUP_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            SETUP_CACHE.write_text(json.dumps(cache))
+        except OSError:
+            pass
+    return result.returncode, result.stdout
+
 def check_pip():
     """Check if pip is available"""
-    try:
-        subprocess.run([sys.executable, "-m", "pip", "--version"], 
-                      capture_output=True, check=True)
+    # Answerable in-process: "python -m pip" works exactly when the pip package is importable
+    if importlib.util.find_spec("pip") is not None:
         print_success("pip is installed")
         return True
-    except:
-        print_error("pip is not installed")
-        return False
+    
+    print_error("pip is not installed")
+    return False
 
 def install_requirements():
     """Install Python dependencies"""
@@ -67,73 +218,208 @@ def install_requirements():
         print_error("requirements.txt not found")
         return False
     
-    try:
-        print("Installing packages (this may take a few minutes)...")
-        subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
-            check=True
-        )
-        print_success("All Python packages installed")
-        return True
-    except subprocess.CalledProcessError:
-        print_error("Failed to install some packages")
-        return False
-
-def check_tesseract():
-    """Check if Tesseract OCR is installed"""
-    print_header("Checking Tesseract OCR")
+    # Same requirements on the same Python, and everything still importable: nothing to do
+    digest = hashlib.sha256(requirements_file.read_bytes() + sys.version.encode()).hexdigest()
+    if REQUIREMENTS_STAMP.exists() and REQUIREMENTS_STAMP.read_text().strip() == digest:
+        if all(importlib.util.find_spec(module) is not None for module, _ in REQUIRED_MODULES):
+            print_success("requirements.txt unchanged since the last install, skipping pip")
+            return True
     
+    pip_install = [sys.executable, "-m", "pip", "install",
+                   "--cache-dir", str(PIP_CACHE_DIR),
+                   "--prefer-binary",
+                   "--disable-pip-version-check",
+                   "--progress-bar", "off"]
+    PIP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    PIP_LOG.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(PIP_LOG, "wb") as log:
+        # A lock written after requirements.txt last changed pins every package,
+        # so pip can skip dependency resolution entirely
+        if (REQUIREMENTS_LOCK.exists()
+                and REQUIREMENTS_LOCK.stat().st_mtime >= requirements_file.stat().st_mtime):
+            print_text("Installing pinned packages from requirements.lock...")
+            if _run_logged(pip_install + ["--no-deps", "-r", str(REQUIREMENTS_LOCK)], log) == 0:
+                REQUIREMENTS_STAMP.write_text(digest)
+                print_success("All Python packages installed")
+                return True
+            print_warning("requirements.lock install failed, resolving requirements.txt instead")
+        
+        print_text("Installing packages (this may take a few minutes)...")
+        if _run_logged(pip_install + ["-r", "requirements.txt"], log) != 0:
+            print_error(f"Failed to install some packages (see {PIP_LOG})")
+            return False
+    
+    REQUIREMENTS_STAMP.write_text(digest)
+    write_requirements_lock()
+    print_success("All Python packages installed")
+    return True
+
+def _run_logged(cmd, log):
+    """
+    Run a command with its output going to a log file, spinning on the terminal meanwhile
+    
+    Args:
+        cmd: Command to run
+        log: Binary file object that receives stdout and stderr
+    
+    Returns:
+        The command's return code
+    """
+    log.flush()
+    process = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT)
+    
+    # Redrawing one character in place is cheap; skip it when nobody is watching
+    if sys.stdout.isatty():
+        done = threading.Event()
+        
+        def spin():
+            for glyph in itertools.cycle("|/-\\"):
+                if done.wait(0.5):
+                    break
+                sys.stdout.write(f"\r   {glyph} ")
+                sys.stdout.flush()
+            sys.stdout.write("\r     \r")
+            sys.stdout.flush()
+        
+        spinner = threading.Thread(target=spin, daemon=True)
+        spinner.start()
+        try:
+            return process.wait()
+        finally:
+            done.set()
+            spinner.join()
+    return process.wait()
+
+def _canonical(name):
+    """PEP 503 normalized project name ("Pillow" and "pillow", "python_dateutil" and "python-dateutil" match)"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def requirement_closure(requirements_file):
+    """
+    Installed distributions that requirements_file pulls in, directly or as dependencies
+    
+    Args:
+        requirements_file: requirements.txt path
+    
+    Returns:
+        Dict of canonical name -> importlib.metadata.Distribution
+    """
+    pending = []
+    for line in requirements_file.read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line and not line.startswith("-"):
+            pending.append(REQUIREMENT_NAME_RE.match(line).group(0))
+    
+    closure = {}
+    while pending:
+        name = _canonical(pending.pop())
+        if name in closure or name in LOCK_EXCLUDE:
+            continue
+        try:
+            dist = importlib.metadata.distribution(name)
+        except importlib.metadata.PackageNotFoundError:
+            continue  # e.g. a dependency whose environment marker doesn't apply here
+        closure[name] = dist
+        for requirement in dist.requires or []:
+            # Dependencies of extras nobody asked for aren't part of the install
+            if "extra ==" not in requirement and "extra==" not in requirement:
+                pending.append(REQUIREMENT_NAME_RE.match(requirement).group(0))
+    return closure
+
+def write_requirements_lock():
+    """Pin the versions requirements.txt resolved to in requirements.lock for the next run"""
+    # Only the requirements' dependency closure: pinning everything in the interpreter
+    # would make the --no-deps reinstall touch pip, setuptools and unrelated packages
+    closure = requirement_closure(Path("requirements.txt"))
+    if closure:
+        REQUIREMENTS_LOCK.write_text("".join(
+            f"{dist.metadata['Name']}=={dist.version}\n"
+            for _, dist in sorted(closure.items())
+        ))
+
+def probe_tesseract():
+    """Return the Tesseract version line, or None if it isn't installed"""
     try:
-        result = subprocess.run(["tesseract", "--version"], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            version = result.stdout.split('\n')[0]
-            print_success(f"Tesseract is installed: {version}")
-            return True
+        returncode, stdout = _cached_probe(["tesseract", "--version"], "tesseract")
+        if returncode == 0:
+            return stdout.split('\n')[0]
     except FileNotFoundError:
         pass
+    return None
+
+def check_tesseract(version=_NOT_PROBED):
+    """Check if Tesseract OCR is installed (version: result of an earlier probe_tesseract)"""
+    print_header("Checking Tesseract OCR")
+    
+    if version is _NOT_PROBED:
+        version = probe_tesseract()
+    
+    if version is not None:
+        print_success(f"Tesseract is installed: {version}")
+        return True
     
     print_warning("Tesseract OCR is not installed")
-    print("\n📥 Installation instructions:")
+    print_text("\n📥 Installation instructions:")
     
     system = platform.system()
     if system == "Windows":
-        print("   Windows: Download from https://github.com/UB-Mannheim/tesseract/wiki")
-        print("   After installation, add to PATH or update ocr_processor.py")
+        print_text("   Windows: Download from https://github.com/UB-Mannheim/tesseract/wiki")
+        print_text("   After installation, add to PATH or update ocr_processor.py")
     elif system == "Darwin":
-        print("   macOS: Run 'brew install tesseract'")
+        print_text("   macOS: Run 'brew install tesseract'")
     elif system == "Linux":
-        print("   Linux: Run 'sudo apt-get install tesseract-ocr'")
+        print_text("   Linux: Run 'sudo apt-get install tesseract-ocr'")
     
     return False
 
-def check_ollama():
-    """Check if Ollama is installed"""
-    print_header("Checking Ollama (Optional)")
+def probe_ollama():
+    """Return the names of the installed Ollama models, or None if Ollama isn't running"""
+    # A closed port refuses the connection at once; skip the HTTP client in that case
+    try:
+        socket.create_connection(("127.0.0.1", 11434), timeout=0.25).close()
+    except OSError:
+        return None
     
+    # One GET with the stdlib client; importing requests would cost more than the request
     try:
-        import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=2)
-        if response.status_code == 200:
-            models = response.json().get('models', [])
-            print_success(f"Ollama is running with {len(models)} model(s)")
-            
-            if models:
-                print("\n📋 Available models:")
-                for model in models:
-                    print(f"   - {model['name']}")
-            else:
-                print_warning("No models installed. Run: ollama pull llama3.2:1b")
-            
-            return True
+        conn = http.client.HTTPConnection("127.0.0.1", 11434, timeout=2)
+        try:
+            conn.request("GET", "/api/tags")
+            response = conn.getresponse()
+            if response.status == 200:
+                # Only the names are shown, so pick them out of the body without building the model dicts
+                return OLLAMA_NAME_RE.findall(response.read().decode("utf-8", "replace"))
+        finally:
+            conn.close()
     except:
         pass
+    return None
+
+def check_ollama(models=_NOT_PROBED):
+    """Check if Ollama is installed (models: result of an earlier probe_ollama)"""
+    print_header("Checking Ollama (Optional)")
+    
+    if models is _NOT_PROBED:
+        models = probe_ollama()
+    
+    if models is not None:
+        print_success(f"Ollama is running with {len(models)} model(s)")
+        
+        if models:
+            print_text("\n📋 Available models:")
+            for name in models:
+                print_text(f"   - {name}")
+        else:
+            print_warning("No models installed. Run: ollama pull llama3.2:1b")
+        
+        return True
     
     print_warning("Ollama is not running (will use fallback analysis)")
-    print("\n💡 For better LLM analysis:")
-    print("   1. Install from: https://ollama.ai")
-    print("   2. Run: ollama pull llama3.2:1b")
-    print("   3. Ollama will run in background")
+    print_text("\n💡 For better LLM analysis:")
+    print_text("   1. Install from: https://ollama.ai")
+    print_text("   2. Run: ollama pull llama3.2:1b")
+    print_text("   3. Ollama will run in background")
     
     return False
 
@@ -152,64 +438,87 @@ def create_directories():
         "modules/automation"
     ]
     
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+    module_dirs = ["modules", "modules/capture", "modules/processing", 
+                   "modules/llm", "modules/storage", "modules/automation"]
+    
+    # Every directory and ancestor once, parents first, instead of mkdir(parents=True) re-walking "modules/"
+    all_dirs = set()
+    for directory in directories + module_dirs:
+        path = Path(directory)
+        all_dirs.add(path)
+        all_dirs.update(p for p in path.parents if p != Path("."))
     
-    # Create __init__.py files
-    for module_dir in ["modules", "modules/capture", "modules/processing", 
-                       "modules/llm", "modules/storage", "modules/automation"]:
-        init_file = Path(module_dir) / "__init__.py"
-        init_file.touch(exist_ok=True)
+    for path in sorted(all_dirs, key=lambda p: len(p.parts)):
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+    
+    # Create __init__.py files (O_CREAT leaves existing ones untouched)
+    for module_dir in module_dirs:
+        os.close(os.open(os.path.join(module_dir, "__init__.py"), os.O_CREAT | os.O_WRONLY, 0o644))
     
     print_success(f"Created {len(directories)} directories")
     return True
 
-def check_disk_space():
-    """Check available disk space"""
-    print_header("Checking Disk Space")
-    
+def probe_disk_space():
+    """Return free disk space in GB, or None if it can't be read"""
     try:
         import shutil
-        stats = shutil.disk_usage(".")
-        free_gb = stats.free / (1024**3)
-        
+        return shutil.disk_usage(".").free / (1024**3)
+    except:
+        return None
+
+def check_disk_space(free_gb=_NOT_PROBED):
+    """Check available disk space (free_gb: result of an earlier probe_disk_space)"""
+    print_header("Checking Disk Space")
+    
+    if free_gb is _NOT_PROBED:
+        free_gb = probe_disk_space()
+    
+    if free_gb is not None:
         if free_gb > 5:
             print_success(f"Available space: {free_gb:.1f} GB")
             return True
         else:
             print_warning(f"Low disk space: {free_gb:.1f} GB")
-            print("   Recommended: At least 5 GB free for recordings")
+            print_text("   Recommended: At least 5 GB free for recordings")
             return True
-    except:
-        print_warning("Could not check disk space")
+    
+    print_warning("Could not check disk space")
+    return True
+
+def module_available(module_name, deep=False):
+    """
+    Check whether a module is installed
+    
+    By default only its location on sys.path is looked up; deep=True really
+    imports it (slow: whisper pulls in torch, cv2 loads its native libraries).
+    """
+    if not deep:
+        return importlib.util.find_spec(module_name) is not None
+    try:
+        __import__(module_name)
         return True
+    except ImportError:
+        return False
 
-def test_imports():
-    """Test if all required modules can be imported"""
+def test_imports(deep=False):
+    """Test if all required modules can be imported (deep=True imports them for real)"""
     print_header("Testing Module Imports")
     
-    required_modules = [
-        ("PIL", "Pillow"),
-        ("numpy", "numpy"),
-        ("cv2", "opencv-python"),
-        ("mss", "mss"),
-        ("sounddevice", "sounddevice"),
-        ("soundfile", "soundfile"),
-        ("whisper", "openai-whisper"),
-        ("pytesseract", "pytesseract"),
-    ]
+    # Probe concurrently (sys.path lookups are filesystem stats), report in list order
+    with ThreadPoolExecutor(max_workers=len(REQUIRED_MODULES)) as executor:
+        found = list(executor.map(lambda m: module_available(m[0], deep), REQUIRED_MODULES))
     
-    all_ok = True
+    # The whole report goes out in one write once every probe is done
+    _emit_all([
+        ("success", package_name) if available
+        else ("error", f"{package_name} - Not found")
+        for (module_name, package_name), available in zip(REQUIRED_MODULES, found)
+    ], flush=True)
     
-    for module_name, package_name in required_modules:
-        try:
-            __import__(module_name)
-            print_success(f"{package_name}")
-        except ImportError:
-            print_error(f"{package_name} - Not found")
-            all_ok = False
-    
-    return all_ok
+    return all(found)
 
 def run_quick_test():
     """Run a quick functionality test"""
@@ -237,11 +546,21 @@ def run_quick_test():
         print_error(f"Test failed: {e}")
         return False
 
-def main():
+def parse_args(argv=None):
+    """Command line options; every prompt has a flag so setup can run unattended"""
+    parser = argparse.ArgumentParser(description="AGI Assistant setup wizard")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="install Python dependencies without asking")
+    parser.add_argument("--skip-install", action="store_true",
+                        help="don't install Python dependencies")
+    parser.add_argument("--deep", action="store_true",
+                        help="fully import every required module instead of only locating it")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main setup routine"""
-    print(f"\n{Colors.BOLD}{'='*60}")
-    print(f"🤖 AGI ASSISTANT - SETUP WIZARD")
-    print(f"{'='*60}{Colors.END}\n")
+    args = parse_args(argv)
+    _emit("title", "🤖 AGI ASSISTANT - SETUP WIZARD")
     
     # Track setup status
     checks = {
@@ -256,22 +575,38 @@ def main():
     # Create directories
     checks["Directories"] = create_directories()
     
-    # Install requirements
-    print("\nDo you want to install Python dependencies? (y/n): ", end='')
-    if input().lower().strip() == 'y':
+    # Install requirements; only ask when someone is there to answer
+    if args.skip_install:
+        install = False
+    elif args.yes:
+        install = True
+    elif sys.stdin.isatty():
+        _emit("prompt", "\nDo you want to install Python dependencies? (y/n): ", flush=True)
+        answer = input()
+        _emit("answer", answer)
+        install = answer.lower().strip() == 'y'
+    else:
+        install = False
+    
+    if install:
         checks["Python Packages"] = install_requirements()
     else:
         print_warning("Skipped Python package installation")
         checks["Python Packages"] = None
     
-    # Check external dependencies
-    checks["Tesseract OCR"] = check_tesseract()
-    checks["Ollama LLM"] = check_ollama()
-    checks["Disk Space"] = check_disk_space()
+    # Check external dependencies: probe side by side (subprocess, HTTP, disk),
+    # then report in a fixed order so the output stays readable
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        tesseract = executor.submit(probe_tesseract)
+        ollama = executor.submit(probe_ollama)
+        disk = executor.submit(probe_disk_space)
+    checks["Tesseract OCR"] = check_tesseract(tesseract.result())
+    checks["Ollama LLM"] = check_ollama(ollama.result())
+    checks["Disk Space"] = check_disk_space(disk.result())
     
     # Test imports if packages were installed
     if checks["Python Packages"]:
-        checks["Module Imports"] = test_imports()
+        checks["Module Imports"] = test_imports(deep=args.deep)
         checks["Quick Test"] = run_quick_test()
     
     # Summary
@@ -289,7 +624,7 @@ def main():
     critical_checks = ["Python Version", "pip", "Python Packages", "Module Imports"]
     critical_ok = all(checks.get(c) for c in critical_checks if checks.get(c) is not None)
     
-    print("\n" + "="*60)
+    print_text("\n" + "="*60)
     if critical_ok:
         print_success("✅ Setup complete! You can now run: python main.py")
         
@@ -301,7 +636,7 @@ def main():
     else:
         print_error("❌ Setup incomplete. Please resolve errors above.")
     
-    print("="*60 + "\n")
+    print_text("="*60 + "\n")
     
     return critical_ok
 
@@ -6,6 +6,7 @@ This script:
 3. Provides Git commands to run
 """
 
+import os
 from pathlib import Path
 
 def create_gitkeep_files():
@@ -19,12 +20,13 @@ def create_gitkeep_files():
     
     print("📁 Creating directory structure...")
     for directory in directories:
-        dir_path = Path(directory)
-        dir_path.mkdir(parents=True, exist_ok=True)
+        # A stat is cheaper than a failing mkdir when the directory is already there
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
         
-        # Create .gitkeep file
-        gitkeep = dir_path / ".gitkeep"
-        gitkeep.touch()
+        # Create .gitkeep file: one open/close, existing files are left untouched
+        gitkeep = os.path.join(directory, ".gitkeep")
+        os.close(os.open(gitkeep, os.O_CREAT | os.O_WRONLY, 0o644))
         print(f"   ✅ Created {gitkeep}")
     
     print("\n✅ Directory structure ready for Git!\n")
@@ -71,11 +73,19 @@ env/
 
 # Data files (recordings - too large!)
 data/clips/*.png
+data/clips/*.zip
 data/clips/*.wav
 data/clips/*.mp4
 data/json/session_summary_*.json
+data/json/session_summary_*.jsonl
 data/workflows/workflow_*.json
 data/learning_database.json
+data/learning_curve.jsonl
+data/.setup_cache.json
+data/.requirements.sha256
+data/pip_install.log
+data/setup.log
+requirements.lock
 
 # Keep directory structure
 !data/clips/.gitkeep
@@ -115,6 +125,13 @@ demo_video.mp4
     
     gitignore_path = Path(".gitignore")
     
+    content_bytes = gitignore_content.encode()
+    
+    # Nothing to do (and nothing to ask) when the file already has this content
+    if gitignore_path.exists() and gitignore_path.read_bytes() == content_bytes:
+        print("✅ .gitignore is up to date\n")
+        return
+    
     if gitignore_path.exists():
         print("⚠️  .gitignore already exists")
         response = input("Overwrite? (y/n): ")
@@ -122,8 +139,7 @@ demo_video.mp4
             print("Skipped .gitignore creation")
             return
     
-    with open(gitignore_path, 'w') as f:
-        f.write(gitignore_content)
+    gitignore_path.write_bytes(content_bytes)
     
     print("✅ Created .gitignore\n")
 